@@ -10,18 +10,24 @@ import time
 import asyncio
 import logging
 import threading
+import multiprocessing
 import random
+import hashlib
+import msgpack
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 
 # Import world simulation
 sys.path.append(os.path.dirname(__file__))
 from world_simulation import WorldSimulationEngine
+from multiprocessing.managers import BaseManager
 import uvicorn
 import threading
 import time
@@ -49,19 +55,63 @@ logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(title="AGI DAX-MVTS Server", version="1.0.0")
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
+STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
+
+class CachedStaticFiles(StaticFiles):
+    """Static files with long-lived caching; the page links them by content hash"""
+    
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+app.mount("/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
+
+class ManagedWorldSimulation(WorldSimulationEngine):
+    """World simulation engine whose run controls are reachable through a manager proxy"""
+    
+    def get_run_state(self):
+        """Current (running, simulation_speed) pair"""
+        return self.running, self.simulation_speed
+    
+    def set_running(self, running: bool):
+        """Start or stop the simulation clock"""
+        self.running = running
+
+class WorldSimulationManager(BaseManager):
+    """Hosts the world simulation engine in its own process"""
+
+WorldSimulationManager.register("WorldSimulationEngine", ManagedWorldSimulation)
+
+# Spawned rather than forked: the server already runs an event loop and threads
+_mp_context = multiprocessing.get_context("spawn")
 
 # Global state
-mvts_core_instance = None
+mvts_core = None
 dax_core_instance = None
 world_simulation = None
-completed_loops = 0
-active_loops = 0
-recent_loops = []
-beliefs_history = []
+world_manager = None
+world_sim_process = None
+autonomous_running = False
 websocket_connections = set()
 processing_lock = asyncio.Lock()
 autonomous_mode = True
 
+# Seconds between checks for dashboard state changes to push
+STATE_PUSH_INTERVAL = 2.0
+
+# Queued broadcasts are sent as one frame per window, capped per frame
+BROADCAST_FLUSH_INTERVAL = 0.016
+BROADCAST_BATCH_SIZE = 50
+broadcast_queue: Optional[asyncio.Queue] = None
+server_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Progress bar fill (percent) shown for each layer status
+LAYER_PROGRESS = {"active": 100, "processing": 55}
+
 class DAXRequest(BaseModel):
     input: str
     include_reasoning: bool = False
@@ -78,6 +128,32 @@ class IntegratedRequest(BaseModel):
     use_dax: bool = True
     context: Dict[str, Any] = {}
 
+# Keyword tables used by the analysis helpers, built once at import.
+# Keywords match anywhere in the lowercased text (as substrings), so plurals
+# and stems such as "risks" or "complexity" still count.
+_POSITIVE_WORDS = ("good", "great", "excellent", "amazing", "wonderful", "fantastic", "positive", "happy", "love", "best")
+_NEGATIVE_WORDS = ("bad", "terrible", "awful", "horrible", "negative", "hate", "worst", "sad", "angry", "poor")
+_HIGH_RISK_WORDS = ("dangerous", "harmful", "illegal", "unethical", "unsafe", "risk", "threat", "vulnerable")
+_MEDIUM_RISK_WORDS = ("challenge", "difficult", "complex", "uncertain", "potential")
+_TOPIC_KEYWORDS = {
+    "technology": ("computer", "software", "programming", "code", "algorithm", "data", "system"),
+    "business": ("company", "market", "revenue", "profit", "customer", "strategy", "management"),
+    "science": ("research", "study", "experiment", "hypothesis", "theory", "analysis", "method"),
+    "health": ("medical", "health", "treatment", "patient", "disease", "diagnosis", "therapy"),
+    "education": ("learning", "teaching", "student", "knowledge", "curriculum", "education", "school")
+}
+
+def _any_of(words):
+    """One alternation regex that finds any of the keywords as a substring"""
+    return re.compile("|".join(map(re.escape, words)))
+
+_HIGH_RISK_RE = _any_of(_HIGH_RISK_WORDS)
+_MEDIUM_RISK_RE = _any_of(_MEDIUM_RISK_WORDS)
+_TOPIC_RES = [(topic, _any_of(keywords)) for topic, keywords in _TOPIC_KEYWORDS.items()]
+_QUESTION_RE = re.compile(r"\b(what|how|why|when|where|who|which|can|could|would|should|is|are|do|does)\b", re.I)
+_COMMAND_RE = re.compile(r"\b(create|make|build|implement|develop|design|write|generate|produce)\b", re.I)
+_ANALYSIS_RE = re.compile(r"\b(analyze|evaluate|assess)\b", re.I)
+
 class AGILLMCore:
     """Advanced Local LLM with AGI-like behavior"""
     
@@ -86,6 +162,8 @@ class AGILLMCore:
         self.layers = self._initialize_layers()
         self.memory = []
         self.learning_patterns = {}
+        # Analysis is pure for a given string, so repeated inputs hit the cache
+        self._quick_core = lru_cache(maxsize=512)(self._analyze_and_respond)
         logger.info("AGI DAX Core initialized")
     
     def _initialize_layers(self):
@@ -131,11 +209,9 @@ class AGILLMCore:
     
     def _analyze_sentiment(self, text: str) -> str:
         """Analyze sentiment of text"""
-        positive_words = ["good", "great", "excellent", "amazing", "wonderful", "fantastic", "positive", "happy", "love", "best"]
-        negative_words = ["bad", "terrible", "awful", "horrible", "negative", "hate", "worst", "sad", "angry", "poor"]
-        
-        pos_count = sum(1 for word in positive_words if word in text.lower())
-        neg_count = sum(1 for word in negative_words if word in text.lower())
+        text_lower = text.lower()
+        pos_count = sum(1 for word in _POSITIVE_WORDS if word in text_lower)
+        neg_count = sum(1 for word in _NEGATIVE_WORDS if word in text_lower)
         
         if pos_count > neg_count:
             return "positive"
@@ -156,15 +232,11 @@ class AGILLMCore:
     
     def _analyze_intent(self, text: str) -> str:
         """Analyze user intent"""
-        question_words = ["what", "how", "why", "when", "where", "who", "which", "can", "could", "would", "should", "is", "are", "do", "does"]
-        command_words = ["create", "make", "build", "implement", "develop", "design", "write", "generate", "produce"]
-        
-        text_lower = text.lower()
-        if any(word in text_lower for word in question_words):
+        if _QUESTION_RE.search(text):
             return "question"
-        elif any(word in text_lower for word in command_words):
+        elif _COMMAND_RE.search(text):
             return "command"
-        elif "analyze" in text_lower or "evaluate" in text_lower or "assess" in text_lower:
+        elif _ANALYSIS_RE.search(text):
             return "analysis"
         return "general"
     
@@ -187,32 +259,15 @@ class AGILLMCore:
     
     def _extract_topics(self, text: str) -> List[str]:
         """Extract main topics"""
-        topic_keywords = {
-            "technology": ["computer", "software", "programming", "code", "algorithm", "data", "system"],
-            "business": ["company", "market", "revenue", "profit", "customer", "strategy", "management"],
-            "science": ["research", "study", "experiment", "hypothesis", "theory", "analysis", "method"],
-            "health": ["medical", "health", "treatment", "patient", "disease", "diagnosis", "therapy"],
-            "education": ["learning", "teaching", "student", "knowledge", "curriculum", "education", "school"]
-        }
-        
         text_lower = text.lower()
-        topics = []
-        
-        for topic, keywords in topic_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
-                topics.append(topic)
-        
-        return topics
+        return [topic for topic, pattern in _TOPIC_RES if pattern.search(text_lower)]
     
     def _assess_risk(self, text: str) -> str:
         """Assess risk level"""
-        high_risk_words = ["dangerous", "harmful", "illegal", "unethical", "unsafe", "risk", "threat", "vulnerable"]
-        medium_risk_words = ["challenge", "difficult", "complex", "uncertain", "potential"]
-        
         text_lower = text.lower()
-        if any(word in text_lower for word in high_risk_words):
+        if _HIGH_RISK_RE.search(text_lower):
             return "high"
-        elif any(word in text_lower for word in medium_risk_words):
+        elif _MEDIUM_RISK_RE.search(text_lower):
             return "medium"
         return "low"
     
@@ -230,22 +285,26 @@ class AGILLMCore:
         
         return "medium"
     
+    def _analyze_and_respond(self, input_text: str):
+        """Analyze input and generate the matching response"""
+        analysis = self._analyze_input(input_text)
+        return self._generate_intelligent_response(input_text, analysis), analysis
+    
     async def quick_process(self, input_text: str) -> str:
         """Intelligent quick processing"""
-        analysis = self._analyze_input(input_text)
+        response, analysis = self._quick_core(input_text)
+        self.remember(input_text, analysis)
         
-        # Store in memory for learning
+        await asyncio.sleep(0.3)  # Simulate processing time
+        return response
+    
+    def remember(self, input_text: str, analysis: Dict[str, Any]):
+        """Store an analyzed input in memory for learning"""
         self.memory.append({
             "input": input_text,
             "analysis": analysis,
             "timestamp": datetime.now().isoformat()
         })
-        
-        # Generate intelligent response based on analysis
-        response = self._generate_intelligent_response(input_text, analysis)
-        
-        await asyncio.sleep(0.3)  # Simulate processing time
-        return response
     
     def _generate_intelligent_response(self, input_text: str, analysis: Dict[str, Any]) -> str:
         """Generate intelligent response based on analysis"""
@@ -411,10 +470,29 @@ class AGILLMCore:
 # Initialize AGI LLM
 agi_llm = AGILLMCore()
 
+# Fixed goals for the autonomous processor
+AUTONOMOUS_GOALS = [
+    "Analyze system performance patterns and suggest optimizations",
+    "Review recent governance decisions for learning opportunities",
+    "Evaluate cognitive loop effectiveness and adaptation strategies",
+    "Generate insights from belief state evolution and memory patterns",
+    "Assess emerging risks and develop proactive mitigation strategies",
+    "Synthesize cross-domain knowledge for enhanced decision making"
+]
+
+# goal -> (analysis, response), filled once at startup
+_PRECOMPUTED: Dict[str, tuple] = {}
+
+def precompute_autonomous_goals():
+    """Analyze each autonomous goal once so the processor does no per-tick work"""
+    for goal in AUTONOMOUS_GOALS:
+        analysis = agi_llm._analyze_input(goal)
+        _PRECOMPUTED[goal] = (analysis, agi_llm._generate_intelligent_response(goal, analysis))
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize AGI server"""
-    global mvts_core, autonomous_running, world_simulation
+    global mvts_core, autonomous_running, world_simulation, world_manager, world_sim_process, broadcast_queue, server_loop
     
     try:
         # Initialize MVTS
@@ -424,18 +502,30 @@ async def startup_event():
             "rule_application_interval": 15
         })
         
-        # Initialize world simulation
-        world_simulation = WorldSimulationEngine()
+        # Specialize the autonomous workload up front
+        precompute_autonomous_goals()
+        
+        # Initialize world simulation in a separate process; handlers talk to it via a proxy.
+        # Both processes start before any of our own threads
+        world_manager = WorldSimulationManager(ctx=_mp_context)
+        world_manager.start()
+        world_simulation = world_manager.WorldSimulationEngine()
         logger.info("World simulation initialized with 8.2 billion population")
         
+        # Drive the world simulation clock from its own process
+        world_sim_process = _mp_context.Process(target=run_world_simulation, args=(world_simulation,), daemon=True)
+        world_sim_process.start()
+        
         # Start autonomous processing
         autonomous_running = True
         autonomous_thread = threading.Thread(target=autonomous_processor, daemon=True)
         autonomous_thread.start()
         
-        # Start world simulation in background
-        world_sim_thread = threading.Thread(target=run_world_simulation, daemon=True)
-        world_sim_thread.start()
+        # Push dashboard state over the WebSocket instead of having clients poll
+        server_loop = asyncio.get_running_loop()
+        broadcast_queue = asyncio.Queue()
+        asyncio.create_task(broadcast_batcher())
+        asyncio.create_task(state_pusher())
         
         logger.info("AGI DAX-MVTS server initialized successfully")
         
@@ -443,15 +533,35 @@ async def startup_event():
         logger.error(f"Failed to initialize server: {e}")
         autonomous_running = False
 
-def run_world_simulation():
-    """Run world simulation in background thread"""
-    global world_simulation
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the world simulation process, then the manager it talks to"""
+    if world_sim_process:
+        world_sim_process.terminate()
+        world_sim_process.join(timeout=5)
+    if world_manager:
+        world_manager.shutdown()
+
+def run_world_simulation(simulation):
+    """Run the world simulation outside the server process, as WorldSimulationEngine.run_simulation does"""
+    simulation.set_running(True)
+    days_simulated = 0
     
     try:
-        import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(world_simulation.run_simulation())
+        while True:
+            running, simulation_speed = simulation.get_run_state()
+            if not running:
+                break
+            
+            day_result = simulation.simulate_day()
+            days_simulated += 1
+            
+            # Log progress every 30 days
+            if days_simulated % 30 == 0:
+                logger.info(f"Simulated {days_simulated} days. Population: {day_result['population']:,}, "
+                          f"Happiness: {day_result['happiness_index']:.3f}")
+            
+            time.sleep(1.0 / simulation_speed)
     except Exception as e:
         logger.error(f"World simulation error: {e}")
 
@@ -459,19 +569,10 @@ def autonomous_processor():
     """Background autonomous AGI processing"""
     global autonomous_running
     
-    autonomous_goals = [
-        "Analyze system performance patterns and suggest optimizations",
-        "Review recent governance decisions for learning opportunities",
-        "Evaluate cognitive loop effectiveness and adaptation strategies",
-        "Generate insights from belief state evolution and memory patterns",
-        "Assess emerging risks and develop proactive mitigation strategies",
-        "Synthesize cross-domain knowledge for enhanced decision making"
-    ]
-    
     while autonomous_running:
         try:
             if mvts_core and random.random() < 0.5:  # 50% chance per cycle
-                goal = random.choice(autonomous_goals)
+                goal = random.choice(AUTONOMOUS_GOALS)
                 
                 # Run async function in thread
                 loop = asyncio.new_event_loop()
@@ -480,7 +581,8 @@ def autonomous_processor():
                 try:
                     # Process through MVTS with AGI enhancement
                     context = {"autonomous": True, "agi_enhanced": True}
-                    agi_result = loop.run_until_complete(agi_llm.quick_process(goal))
+                    analysis, agi_result = _PRECOMPUTED[goal]
+                    agi_llm.remember(goal, analysis)
                     context["agi_analysis"] = agi_result
                     
                     result = loop.run_until_complete(mvts_core.process_goal(goal, context))
@@ -504,29 +606,43 @@ def autonomous_processor():
             time.sleep(60)
 
 def broadcast_update(message: Dict[str, Any]):
-    """Broadcast update to all WebSocket connections"""
-    if websocket_connections:
-        message_str = json.dumps(message)
-        disconnected = []
-        
-        for ws in websocket_connections:
-            try:
-                asyncio.run(ws.send_text(message_str))
-            except:
-                disconnected.append(ws)
-        
-        for ws in disconnected:
-            if ws in websocket_connections:
-                websocket_connections.remove(ws)
+    """Queue an update for the next batched broadcast; safe to call from any thread"""
+    if server_loop is None or not websocket_connections:
+        return
+    server_loop.call_soon_threadsafe(broadcast_queue.put_nowait, message)
+
+async def broadcast_batcher():
+    """Send queued broadcasts as batched frames"""
+    while True:
+        batch = [await broadcast_queue.get()]
+        # Let a burst accumulate, then send it as one frame
+        await asyncio.sleep(BROADCAST_FLUSH_INTERVAL)
+        while len(batch) < BROADCAST_BATCH_SIZE and not broadcast_queue.empty():
+            batch.append(broadcast_queue.get_nowait())
+        try:
+            await send_to_websockets(pack_batch(batch))
+        except Exception as e:
+            logger.error(f"Broadcast error: {e}")
 
 @app.get("/", response_class=HTMLResponse)
 async def home():
     """Main AGI web interface"""
-    return HTML_RESPONSE
-
-@app.get("/health")
-async def health_check():
-    """Health check endpoint"""
+    # Embed the current dashboard state so first paint needs no extra requests;
+    # without it the client falls back to the WebSocket and fetches
+    try:
+        boot_state = json.dumps(await asyncio.to_thread(_current_snapshot)).replace("</", "<\\/").encode("utf-8")
+    except Exception as e:
+        logger.error(f"Boot state error: {e}")
+        boot_state = b"null"
+    # Starlette derives Content-Length from the bytes body; join copies the page once
+    return Response(content=b"".join((_HTML_HEAD, boot_state, _HTML_TAIL)), media_type="text/html",
+                    headers={"Cache-Control": "no-cache"})
+
+def _health_payload() -> Dict[str, Any]:
+    """Build the health payload"""
+    # Loop stats come from this worker's mvts_core; with several workers each
+    # reports its own core, so the numbers differ between workers
+    mvts_status = mvts_core.get_system_status() if mvts_core else {}
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
@@ -537,20 +653,61 @@ async def health_check():
             "autonomous": autonomous_running
         },
         "stats": {
-            "completed_loops": completed_loops,
-            "active_loops": active_loops,
-            "recent_loops": len(recent_loops),
-            "beliefs_tracked": len(beliefs_history)
+            "completed_loops": mvts_status.get("completed_loops", 0),
+            "active_loops": mvts_status.get("active_loops", 0),
+            "recent_loops": min(mvts_status.get("completed_loops", 0), 10),
+            "memories": mvts_status.get("memory_size", 0)
         }
     }
 
+def _fingerprint(payload: Dict[str, Any]) -> str:
+    """Stable serialization of a payload; timestamps alone do not count as a change"""
+    return json.dumps({k: v for k, v in payload.items() if k != "timestamp"}, sort_keys=True)
+
+def _etag(fingerprint: str) -> str:
+    """Weak ETag for a payload fingerprint"""
+    return 'W/"%s"' % hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:16]
+
+def _conditional_json(request: Request, body: bytes, etag: str, cache_control: str = "no-cache") -> Response:
+    """Serve a JSON body, or 304 when the client already holds this version"""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@lru_cache(maxsize=2)
+def _health_body(second: int) -> tuple:
+    """Serialized health payload and its ETag, rebuilt at most once per second"""
+    payload = _health_payload()
+    return json.dumps(payload).encode("utf-8"), _etag(_fingerprint(payload))
+
+@app.get("/health")
+async def health_check(request: Request):
+    """Health check endpoint"""
+    body, etag = _health_body(int(time.time()))
+    return _conditional_json(request, body, etag, "public, max-age=1")
+
+@lru_cache(maxsize=2)
+def _dashboard_body(quarter_second: int) -> tuple:
+    """Serialized dashboard snapshot and its ETag, rebuilt at most every 250ms"""
+    snapshot = _cached_snapshot(quarter_second)
+    fingerprint = "".join(_fingerprint(payload) for payload in snapshot.values())
+    return json.dumps(snapshot).encode("utf-8"), _etag(fingerprint)
+
+@app.get("/api/dashboard")
+async def get_dashboard(request: Request):
+    """Health, layers, beliefs, loops and world stats in one response"""
+    # The snapshot queries the world simulation proxy, which blocks
+    body, etag = await asyncio.to_thread(_dashboard_body, int(time.time() * 4))
+    return _conditional_json(request, body, etag)
+
 @app.get("/api/world/stats")
 async def get_world_stats():
     """Get world simulation statistics"""
     if not world_simulation:
         raise HTTPException(status_code=503, detail="World simulation not initialized")
     
-    return world_simulation.get_statistics()
+    return await asyncio.to_thread(world_simulation.get_statistics)
 
 @app.get("/api/world/demographics")
 async def get_world_demographics():
@@ -558,7 +715,7 @@ async def get_world_demographics():
     if not world_simulation:
         raise HTTPException(status_code=503, detail="World simulation not initialized")
     
-    return world_simulation.get_detailed_demographics()
+    return await asyncio.to_thread(world_simulation.get_detailed_demographics)
 
 @app.post("/api/world/simulate")
 async def simulate_world_day():
@@ -566,7 +723,7 @@ async def simulate_world_day():
     if not world_simulation:
         raise HTTPException(status_code=503, detail="World simulation not initialized")
     
-    result = world_simulation.simulate_day()
+    result = await asyncio.to_thread(world_simulation.simulate_day)
     return result
 
 @app.post("/api/world/policy")
@@ -575,7 +732,10 @@ async def apply_world_policy(policy: dict):
     if not world_simulation:
         raise HTTPException(status_code=503, detail="World simulation not initialized")
     
-    result = world_simulation.apply_policy_intervention(policy)
+    # Sent immediately rather than queued: the intervention blocks until it finishes
+    await send_to_websockets(pack_batch([{"type": "policy_progress", "data": {"pct": 0}}]))
+    result = await asyncio.to_thread(world_simulation.apply_policy_intervention, policy)
+    await send_to_websockets(pack_batch([{"type": "policy_progress", "data": {"pct": 100}}]))
     return result
 
 @app.get("/api/world/export")
@@ -584,7 +744,7 @@ async def export_world_data(format: str = "json"):
     if not world_simulation:
         raise HTTPException(status_code=503, detail="World simulation not initialized")
     
-    data = world_simulation.export_data(format)
+    data = await asyncio.to_thread(world_simulation.export_data, format)
     return {"data": data, "format": format}
 
 @app.post("/api/dax/process")
@@ -678,18 +838,19 @@ async def process_integrated(request: IntegratedRequest):
                 "success": False
             }
     
-    # Broadcast update
+    # Broadcast update; the shared timestamp lets the caller skip its own echo
+    timestamp = datetime.now().isoformat()
     broadcast_update({
         "type": "integrated_process",
         "input": request.input,
         "results": results,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": timestamp
     })
     
     return {
         "input": request.input,
         "results": results,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": timestamp
     }
 
 @app.get("/api/status")
@@ -710,14 +871,19 @@ async def get_status():
     return status
 
 @app.get("/api/loops")
-async def get_loops():
+async def get_loops(request: Request):
     """Get cognitive loop history"""
     if not mvts_core:
         raise HTTPException(status_code=503, detail="MVTS not available")
     
+    payload = _loops_payload()
+    return _conditional_json(request, json.dumps(payload).encode("utf-8"), _etag(_fingerprint(payload)))
+
+def _loops_payload() -> Dict[str, Any]:
+    """Build the cognitive loop history payload"""
     return {
         "active_loops": len(mvts_core.active_loops),
-        "completed_loops": len(mvts_core.loop_history),
+        "completed_loops": mvts_core.completed_loop_count,
         "recent_loops": [
             {
                 "loop_id": loop.loop_id,
@@ -727,16 +893,21 @@ async def get_loops():
                 "timestamp": loop.start_time,
                 "duration": mvts_core.calculate_duration(loop.start_time, loop.end_time)
             }
-            for loop in mvts_core.loop_history[-10:]
+            for loop in mvts_core.recent_loops(10)
         ]
     }
 
 @app.get("/api/beliefs")
-async def get_beliefs():
+async def get_beliefs(request: Request):
     """Get current belief state"""
     if not mvts_core:
         raise HTTPException(status_code=503, detail="MVTS not available")
     
+    payload = _beliefs_payload()
+    return _conditional_json(request, json.dumps(payload).encode("utf-8"), _etag(_fingerprint(payload)))
+
+def _beliefs_payload() -> Dict[str, Any]:
+    """Build the current belief state payload"""
     beliefs = mvts_core.state_store.get_beliefs()
     return {
         "coherence": beliefs.coherence,
@@ -746,13 +917,114 @@ async def get_beliefs():
         "last_updated": beliefs.last_updated
     }
 
+def _layers_payload() -> Dict[str, Any]:
+    """Build the DAX layer payload with a stable progress value per layer"""
+    return {
+        "layers": [
+            {
+                "name": layer["name"],
+                "status": layer["status"],
+                "progress": LAYER_PROGRESS.get(layer["status"], 0)
+            }
+            for layer in agi_llm.get_layer_status()
+        ]
+    }
+
+def _state_snapshot() -> Dict[str, Dict[str, Any]]:
+    """Collect every dashboard payload that is pushed over the WebSocket"""
+    snapshot = {"health": _health_payload(), "layers": _layers_payload()}
+    if mvts_core:
+        snapshot["beliefs"] = _beliefs_payload()
+        snapshot["loops"] = _loops_payload()
+    if world_simulation:
+        snapshot["world_stats"] = world_simulation.get_statistics()
+    return snapshot
+
+@lru_cache(maxsize=2)
+def _cached_snapshot(quarter_second: int) -> Dict[str, Dict[str, Any]]:
+    """Dashboard snapshot shared by every reader within the same 250ms window"""
+    return _state_snapshot()
+
+def _current_snapshot() -> Dict[str, Dict[str, Any]]:
+    """Current dashboard snapshot; the page, /api/dashboard, WebSocket connects and
+    the state pusher all read it, so the world simulation is queried once per window.
+    The query blocks on the simulation proxy, so async callers run this in a thread"""
+    return _cached_snapshot(int(time.time() * 4))
+
+def pack_batch(messages: List[Dict[str, Any]]) -> bytes:
+    """Encode a list of messages as one binary MessagePack frame"""
+    return msgpack.packb({"batch": messages})
+
+async def send_to_websockets(frame: bytes, connections=None):
+    """Send an encoded frame to the given (default: all) WebSocket clients"""
+    disconnected = []
+    for ws in list(websocket_connections if connections is None else connections):
+        try:
+            await ws.send_bytes(frame)
+        except Exception:
+            disconnected.append(ws)
+    
+    for ws in disconnected:
+        websocket_connections.discard(ws)
+
+def _loops_delta(payload: Dict[str, Any], previous: Optional[Dict[str, str]]):
+    """Reduce a loops payload to the rows changed since the previous push.
+    
+    Returns (message_type, payload, fingerprints); the first push has nothing
+    to diff against and goes out in full.
+    """
+    current = {loop["loop_id"]: json.dumps(loop, sort_keys=True) for loop in payload["recent_loops"]}
+    if previous is None:
+        return "loops", payload, current
+    
+    delta = {
+        "active_loops": payload["active_loops"],
+        "completed_loops": payload["completed_loops"],
+        "added": [loop for loop in payload["recent_loops"] if previous.get(loop["loop_id"]) != current[loop["loop_id"]]],
+        # Full ordering; ids missing from it were dropped
+        "ids": list(current)
+    }
+    return "loops_delta", delta, current
+
+async def state_pusher():
+    """Push dashboard state to WebSocket clients whenever it changes"""
+    last_sent: Dict[str, str] = {}
+    last_loops: Optional[Dict[str, str]] = None
+    
+    while True:
+        await asyncio.sleep(STATE_PUSH_INTERVAL)
+        if not websocket_connections:
+            continue
+        
+        try:
+            snapshot = await asyncio.to_thread(_current_snapshot)
+            for message_type, payload in snapshot.items():
+                fingerprint = _fingerprint(payload)
+                if last_sent.get(message_type) == fingerprint:
+                    continue
+                last_sent[message_type] = fingerprint
+                if message_type == "loops":
+                    message_type, payload, last_loops = _loops_delta(payload, last_loops)
+                broadcast_queue.put_nowait({"type": message_type, "data": payload})
+        except Exception as e:
+            logger.error(f"State pusher error: {e}")
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time updates"""
     await websocket.accept()
-    websocket_connections.append(websocket)
     
     try:
+        websocket_connections.add(websocket)
+        
+        # New clients get the full state once; later pushes only carry changes.
+        # Without it the client still gets the pushes that follow
+        try:
+            snapshot = [{"type": t, "data": payload} for t, payload in (await asyncio.to_thread(_current_snapshot)).items()]
+            await send_to_websockets(pack_batch(snapshot), [websocket])
+        except Exception as e:
+            logger.error(f"Connect snapshot error: {e}")
+        
         while True:
             data = await websocket.receive_text()
             message = json.loads(data)
@@ -763,826 +1035,34 @@ async def websocket_endpoint(websocket: WebSocket):
                     "timestamp": datetime.now().isoformat()
                 }))
     except WebSocketDisconnect:
-        if websocket in websocket_connections:
-            websocket_connections.remove(websocket)
-
-# Enhanced HTML Response with AGI features and all-seeing eye theme
-HTML_RESPONSE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AGI DAX-MVTS Server - All Seeing Eye</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>
-        body {
-            background-image: url('https://images.unsplash.com/photo-1573865526739-10659fec78a5?auto=format&fit=crop&w=1920&q=80');
-            background-size: cover;
-            background-position: center;
-            background-attachment: fixed;
-            color: #1a1a1a;
-        }
-        .sidebar { 
-            width: 380px; 
-            background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(10px);
-            box-shadow: 0 0 30px rgba(139, 92, 246, 0.3);
-        }
-        .main-content { 
-            margin-left: 380px; 
-            background: rgba(255, 255, 255, 0.9);
-            backdrop-filter: blur(5px);
-            min-height: 100vh;
-        }
-        .layer-active { 
-            background: linear-gradient(135deg, #8b5cf6, #7c3aed);
-            color: white;
-            animation: layerPulse 1s infinite;
-        }
-        .layer-processing { 
-            background: linear-gradient(135deg, #f59e0b, #d97706);
-            color: white;
-            animation: layerProcessing 0.5s infinite;
-        }
-        .layer-idle { 
-            background: linear-gradient(135deg, #e5e7eb, #d1d5db);
-            color: #374151;
-        }
-        .agi-available { 
-            border-left: 4px solid #8b5cf6; 
-            background: rgba(139, 92, 246, 0.1);
-        }
-        .agi-pulse { 
-            animation: pulse 2s infinite;
-            background: radial-gradient(circle, #8b5cf6, transparent);
-        }
-        .eye-symbol {
-            width: 60px;
-            height: 60px;
-            background: radial-gradient(circle, #8b5cf6, #4c1d95);
-            border-radius: 50%;
-            position: relative;
-            animation: eyeMove 4s infinite;
-        }
-        .eye-symbol::before {
-            content: '';
-            position: absolute;
-            width: 20px;
-            height: 20px;
-            background: white;
-            border-radius: 50%;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-        }
-        @keyframes pulse {
-            0%, 100% { opacity: 1; transform: scale(1); }
-            50% { opacity: 0.7; transform: scale(1.05); }
-        }
-        @keyframes layerPulse {
-            0%, 100% { transform: scale(1); opacity: 1; }
-            50% { transform: scale(1.02); opacity: 0.9; }
-        }
-        @keyframes layerProcessing {
-            0%, 100% { transform: translateX(0); }
-            50% { transform: translateX(2px); }
-        }
-        @keyframes eyeMove {
-            0%, 100% { transform: translateY(0); }
-            50% { transform: translateY(-5px); }
-        }
-        @media (max-width: 768px) {
-            .sidebar { position: fixed; left: -380px; transition: left 0.3s; z-index: 50; }
-            .sidebar.open { left: 0; }
-            .main-content { margin-left: 0; }
-        }
-        .glass-effect {
-            background: rgba(255, 255, 255, 0.8);
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(139, 92, 246, 0.2);
-        }
-        .layer-visualization {
-            display: flex;
-            flex-direction: column;
-            gap: 4px;
-            padding: 8px;
-            border-radius: 8px;
-            transition: all 0.3s ease;
-        }
-        .layer-bar {
-            height: 8px;
-            border-radius: 4px;
-            background: #e5e7eb;
-            position: relative;
-            overflow: hidden;
-        }
-        .layer-progress {
-            height: 100%;
-            background: linear-gradient(90deg, #8b5cf6, #7c3aed);
-            border-radius: 4px;
-            transition: width 0.5s ease;
-        }
-    </style>
-</head>
-<body>
-    <!-- Mobile Menu Toggle -->
-    <button id="menu-toggle" class="md:hidden fixed top-4 left-4 z-50 p-2 bg-white bg-opacity-80 rounded-lg">
-        <svg class="w-6 h-6 text-gray-800" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M4 6h16M4 12h16M4 18h16"></path>
-        </svg>
-    </button>
-
-    <!-- All-Seeing Eye Header -->
-    <div class="fixed top-0 left-0 right-0 z-40 bg-white bg-opacity-90 backdrop-filter backdrop-blur-lg border-b border-purple-200">
-        <div class="flex items-center justify-between p-4">
-            <div class="flex items-center space-x-4">
-                <div class="eye-symbol"></div>
-                <div>
-                    <h1 class="text-2xl font-bold text-purple-900">AGI DAX-MVTS Server</h1>
-                    <p class="text-sm text-purple-700">All-Seeing Eye Governance System</p>
-                </div>
-            </div>
-            <div class="flex items-center space-x-4">
-                <div id="connection-status" class="flex items-center space-x-2">
-                    <div class="w-3 h-3 bg-green-500 rounded-full animate-pulse"></div>
-                    <span class="text-sm text-gray-700">Connected</span>
-                </div>
-                <div id="agi-status" class="flex items-center space-x-2">
-                    <div class="w-3 h-3 bg-purple-500 rounded-full animate-pulse"></div>
-                    <span class="text-sm text-purple-700">AGI Active</span>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <!-- AGI DAX-MVTS Sidebar -->
-    <div id="sidebar" class="sidebar fixed left-0 top-20 h-full overflow-y-auto">
-        <div class="p-4">
-            <h2 class="text-xl font-bold mb-4 text-purple-900 agi-pulse">DAX Governance Layers</h2>
-            
-            <!-- AGI Status -->
-            <div id="llm-status-card" class="mb-6 p-3 glass-effect rounded-lg agi-available">
-                <h3 class="text-sm font-semibold mb-2 text-purple-900">AGI Core Status</h3>
-                <div id="llm-status" class="flex items-center">
-                    <div class="w-2 h-2 bg-purple-600 rounded-full mr-2 agi-pulse"></div>
-                    <span class="text-sm">Active</span>
-                </div>
-                <div id="llm-details" class="text-xs text-gray-400 mt-1">Model: agi-local</div>
-            </div>
-
-            <!-- Autonomous Status -->
-            <div class="mb-6 p-3 glass-effect rounded-lg">
-                <h3 class="text-sm font-semibold mb-2 text-purple-900">Autonomous Mode</h3>
-                <div id="autonomous-status" class="flex items-center">
-                    <div class="w-2 h-2 bg-green-600 rounded-full mr-2"></div>
-                    <span class="text-sm">Active</span>
-                </div>
-            </div>
-
-            <!-- DAX Layers Visualization -->
-            <div class="space-y-2 mb-6">
-                <h3 class="text-sm font-semibold text-purple-900">DAX 13-Layer Stack</h3>
-                <div id="dax-layers" class="space-y-2">
-                    <!-- Layers will be populated by JavaScript -->
-                </div>
-            </div>
-
-            <!-- Processing Options -->
-            <div class="space-y-3 mb-6">
-                <h3 class="text-sm font-semibold text-purple-900">AGI Processing</h3>
-                
-                <button id="dax-quick-btn" class="w-full px-3 py-2 bg-purple-600 hover:bg-purple-700 text-white rounded text-sm agi-pulse">
-                    AGI Quick Process
-                </button>
-                
-                <button id="mvts-btn" class="w-full px-3 py-2 bg-blue-600 hover:bg-blue-700 text-white rounded text-sm">
-                    MVTS + AGI
-                </button>
-                
-                <button id="integrated-btn" class="w-full px-3 py-2 bg-green-600 hover:bg-green-700 text-white rounded text-sm">
-                    Full Integration
-                </button>
-            </div>
-
-            <!-- World Simulation Controls -->
-            <div class="space-y-3 mb-6">
-                <h3 class="text-sm font-semibold text-purple-900">World Simulation</h3>
-                
-                <button id="world-simulate-btn" class="w-full px-3 py-2 bg-orange-600 hover:bg-orange-700 text-white rounded text-sm">
-                    Simulate Day
-                </button>
-                
-                <button id="world-policy-btn" class="w-full px-3 py-2 bg-teal-600 hover:bg-teal-700 text-white rounded text-sm">
-                    Apply Policy
-                </button>
-                
-                <button id="world-export-btn" class="w-full px-3 py-2 bg-indigo-600 hover:bg-indigo-700 text-white rounded text-sm">
-                    Export Data
-                </button>
-            </div>
-
-            <!-- World Simulation Stats -->
-            <div class="space-y-2 mb-6">
-                <h3 class="text-sm font-semibold text-purple-900">World Simulation</h3>
-                <div class="text-xs space-y-1 text-gray-700">
-                    <div>Population: <span id="world-population" class="font-mono text-purple-700">8.2B</span></div>
-                    <div>Global GDP: <span id="world-gdp" class="font-mono text-purple-700">$96T</span></div>
-                    <div>Happiness: <span id="world-happiness" class="font-mono text-purple-700">0.62</span></div>
-                    <div>Renewable: <span id="world-renewable" class="font-mono text-purple-700">28%</span></div>
-                </div>
-            </div>
-
-            <!-- System Stats -->
-            <div class="space-y-2">
-                <h3 class="text-sm font-semibold text-purple-900">System Intelligence</h3>
-                <div class="text-xs space-y-1 text-gray-700">
-                    <div>Active Loops: <span id="active-loops" class="font-mono text-purple-700">0</span></div>
-                    <div>Completed: <span id="completed-loops" class="font-mono text-purple-700">0</span></div>
-                    <div>Confidence: <span id="sidebar-confidence" class="font-mono">0.000</span></div>
-                    <div>Coherence: <span id="sidebar-coherence" class="font-mono">0.000</span></div>
-                    <div>AGI Status: <span id="dax-health" class="font-mono">Healthy</span></div>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <!-- Main Content -->
-    <div class="main-content pt-20">
-        <div class="container mx-auto px-4 py-6">
-            <!-- Status Cards -->
-            <div class="grid grid-cols-1 md:grid-cols-4 gap-4 mb-8">
-                <div class="glass-effect rounded-lg p-4">
-                    <h3 class="text-sm font-semibold text-purple-900 mb-1">System Status</h3>
-                    <p id="system-status" class="text-2xl font-bold text-purple-700">AGI Active</p>
-                </div>
-                <div class="glass-effect rounded-lg p-4">
-                    <h3 class="text-sm font-semibold text-purple-900 mb-1">Completed Loops</h3>
-                    <p id="completed-loops-main" class="text-2xl font-bold text-purple-700">0</p>
-                </div>
-                <div class="glass-effect rounded-lg p-4">
-                    <h3 class="text-sm font-semibold text-purple-900 mb-1">Confidence</h3>
-                    <p id="confidence-main" class="text-2xl font-bold text-purple-700">0.000</p>
-                </div>
-                <div class="glass-effect rounded-lg p-4">
-                    <h3 class="text-sm font-semibold text-purple-900 mb-1">AGI Core</h3>
-                    <p id="llm-available" class="text-2xl font-bold text-purple-700">Online</p>
-                </div>
-            </div>
-
-            <!-- Input Section -->
-            <div class="glass-effect rounded-lg p-6 mb-8">
-                <h2 class="text-xl font-semibold mb-4 text-purple-900">AGI Intelligence Processing</h2>
-                <div class="space-y-4">
-                    <div>
-                        <label class="block text-sm font-medium text-purple-800 mb-2">Enter your request for AGI analysis</label>
-                        <textarea id="input-text" rows="4" 
-                                  class="w-full px-3 py-2 bg-white bg-opacity-80 border border-purple-300 rounded-lg focus:border-purple-500 focus:outline-none text-gray-800"
-                                  placeholder="Ask me anything, give me commands, or request analysis... I'll process it through AGI intelligence."></textarea>
-                    </div>
-                    <div class="flex space-x-2">
-                        <button id="process-integrated" 
-                                class="px-4 py-2 bg-green-600 hover:bg-green-700 text-white rounded-lg font-semibold transition-colors">
-                            Process Integrated
-                        </button>
-                        <button id="process-dax-only" 
-                                class="px-4 py-2 bg-purple-600 hover:bg-purple-700 text-white rounded-lg font-semibold transition-colors">
-                            AGI Only
-                        </button>
-                        <button id="process-mvts-only" 
-                                class="px-4 py-2 bg-blue-600 hover:bg-blue-700 text-white rounded-lg font-semibold transition-colors">
-                            MVTS Only
-                        </button>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Results Section -->
-            <div class="glass-effect rounded-lg p-6 mb-8">
-                <h2 class="text-xl font-semibold mb-4 text-purple-900">AGI Processing Results</h2>
-                <div id="results-container" class="space-y-4">
-                    <p class="text-gray-400">No processing results yet. Enter a request above to see AGI intelligence in action.</p>
-                </div>
-            </div>
-
-            <!-- Recent Loops -->
-            <div class="glass-effect rounded-lg p-6 mb-8">
-                <h2 class="text-xl font-semibold mb-4 text-purple-900">Recent Cognitive Loops</h2>
-                <div id="loops-list" class="space-y-2">
-                    <p class="text-gray-600">No loops processed yet</p>
-                </div>
-            </div>
-
-            <!-- Beliefs Chart -->
-            <div class="glass-effect rounded-lg p-6">
-                <h2 class="text-xl font-semibold mb-4 text-purple-900">Belief State Evolution</h2>
-                <canvas id="beliefs-chart" width="400" height="200"></canvas>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        let beliefsChart = null;
-        let ws = null;
-
-        // Initialize WebSocket
-        function initWebSocket() {
-            const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-            ws = new WebSocket(`${protocol}//${window.location.host}/ws`);
-            
-            ws.onopen = function() {
-                console.log('WebSocket connected');
-            };
-            
-            ws.onmessage = function(event) {
-                const data = JSON.parse(event.data);
-                handleWebSocketUpdate(data);
-            };
-            
-            ws.onclose = function() {
-                console.log('WebSocket disconnected');
-                setTimeout(initWebSocket, 3000);
-            };
-        }
-
-        function handleWebSocketUpdate(data) {
-            if (data.type === 'autonomous_loop' || data.type === 'mvts_loop') {
-                addLoopToUI(data.result, data.type === 'autonomous_loop' ? 'Autonomous' : 'User');
-                updateStatus();
-            } else if (data.type === 'integrated_process') {
-                displayResults(data.results, data.input);
-            }
-        }
-
-        // Mobile menu toggle
-        document.getElementById('menu-toggle').addEventListener('click', function() {
-            document.getElementById('sidebar').classList.toggle('open');
-        });
-
-        // Initialize chart
-        function initChart() {
-            const ctx = document.getElementById('beliefs-chart').getContext('2d');
-            beliefsChart = new Chart(ctx, {
-                type: 'line',
-                data: {
-                    labels: [],
-                    datasets: [
-                        {
-                            label: 'Confidence',
-                            data: [],
-                            borderColor: 'rgb(139, 92, 246)',
-                            backgroundColor: 'rgba(139, 92, 246, 0.1)',
-                            tension: 0.4
-                        },
-                        {
-                            label: 'Coherence',
-                            data: [],
-                            borderColor: 'rgb(59, 130, 246)',
-                            backgroundColor: 'rgba(59, 130, 246, 0.1)',
-                            tension: 0.4
-                        }
-                    ]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    scales: {
-                        y: { 
-                            min: 0, 
-                            max: 1,
-                            grid: { color: 'rgba(255, 255, 255, 0.1)' },
-                            ticks: { color: 'white' }
-                        },
-                        x: { 
-                            grid: { color: 'rgba(255, 255, 255, 0.1)' },
-                            ticks: { color: 'white' }
-                        }
-                    },
-                    plugins: {
-                        legend: { labels: { color: 'white' } }
-                    }
-                }
-            });
-        }
-
-        // Update DAX layers
-        function updateDAXLayers(layers) {
-            const container = document.getElementById('dax-layers');
-            container.innerHTML = '';
-            
-            Object.entries(layers).forEach(([name, status]) => {
-                const layerDiv = document.createElement('div');
-                layerDiv.className = `layer-visualization ${status === 'active' ? 'layer-active' : status === 'processing' ? 'layer-processing' : 'layer-idle'}`;
-                
-                const progress = status === 'processing' ? Math.random() * 30 + 40 : (status === 'active' ? 100 : 0);
-                
-                layerDiv.innerHTML = `
-                    <div class="flex justify-between items-center mb-1">
-                        <span class="text-xs font-semibold">${name}</span>
-                        <span class="text-xs opacity-75">${status.toUpperCase()}</span>
-                    </div>
-                    <div class="layer-bar">
-                        <div class="layer-progress" style="width: ${progress}%"></div>
-                    </div>
-                `;
-                container.appendChild(layerDiv);
-            });
-        }
-
-        // Update world simulation stats
-        async function updateWorldStats() {
-            try {
-                const response = await fetch('/api/world/stats');
-                const stats = await response.json();
-                
-                // Update world stats
-                document.getElementById('world-population').textContent = 
-                    (stats.total_population / 1_000_000_000).toFixed(1) + 'B';
-                document.getElementById('world-gdp').textContent = 
-                    '$' + (stats.global_gdp_trillion_usd).toFixed(0) + 'T';
-                document.getElementById('world-happiness').textContent = 
-                    stats.happiness_index.toFixed(2);
-                document.getElementById('world-renewable').textContent = 
-                    stats.renewable_energy_percent.toFixed(0) + '%';
-                
-            } catch (error) {
-                console.error('Failed to update world stats:', error);
-            }
-        }
-
-        // World simulation event handlers
-        document.getElementById('world-simulate-btn').addEventListener('click', async () => {
-            try {
-                const response = await fetch('/api/world/simulate', { method: 'POST' });
-                const result = await response.json();
-                
-                // Update world stats after simulation
-                await updateWorldStats();
-                
-                // Show simulation results
-                addResultEntry('world', `Day ${result.date} simulated. Population: ${result.population.toLocaleString()}, Events: ${result.events.length}`);
-            } catch (error) {
-                console.error('World simulation error:', error);
-            }
-        });
-
-        document.getElementById('world-policy-btn').addEventListener('click', async () => {
-            const policyType = prompt('Enter policy type (carbon_tax, education_investment, healthcare_reform, technology_investment, governance_reform):');
-            if (policyType) {
-                try {
-                    const response = await fetch('/api/world/policy', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({
-                            type: policyType,
-                            magnitude: 0.3,
-                            duration: 90
-                        })
-                    });
-                    const result = await response.json();
-                    
-                    // Update world stats after policy
-                    await updateWorldStats();
-                    
-                    // Show policy effects
-                    const effects = Object.entries(result.effects).map(([k, v]) => `${k}: ${(v * 100).toFixed(1)}%`).join(', ');
-                    addResultEntry('world', `Policy applied: ${policyType}. Effects: ${effects}`);
-                } catch (error) {
-                    console.error('Policy application error:', error);
-                }
-            }
-        });
-
-        document.getElementById('world-export-btn').addEventListener('click', async () => {
-            try {
-                const response = await fetch('/api/world/export?format=json');
-                const result = await response.json();
-                
-                // Create downloadable file
-                const blob = new Blob([result.data], { type: 'application/json' });
-                const url = URL.createObjectURL(blob);
-                const a = document.createElement('a');
-                a.href = url;
-                a.download = `world-simulation-${new Date().toISOString().split('T')[0]}.json`;
-                a.click();
-                URL.revokeObjectURL(url);
-                
-                addResultEntry('world', 'World simulation data exported successfully');
-            } catch (error) {
-                console.error('Export error:', error);
-            }
-        });
-
-        // Update status
-        async function updateStatus() {
-            try {
-                const response = await fetch('/health');
-                const status = await response.json();
-                
-                // Update system status
-                document.getElementById('system-status').textContent = status.status === 'healthy' ? 'AGI Active' : 'Unknown';
-                document.getElementById('completed-loops-main').textContent = status.mvts_status?.completed_loops || 0;
-                document.getElementById('completed-loops').textContent = status.mvts_status?.completed_loops || 0;
-                document.getElementById('active-loops').textContent = status.mvts_status?.active_loops || 0;
-                
-                // Update AGI status
-                const llmAvailable = status.llm_available;
-                const llmStatus = document.getElementById('llm-status');
-                const llmDetails = document.getElementById('llm-details');
-                const llmAvailableMain = document.getElementById('llm-available');
-                
-                if (llmAvailable && status.dax_status?.status === 'healthy') {
-                    llmStatus.innerHTML = '<div class="w-2 h-2 bg-purple-400 rounded-full mr-2 agi-pulse"></div><span class="text-sm">Active</span>';
-                    llmDetails.textContent = `Model: ${status.dax_status.model || 'agi-local'} | Memory: ${status.dax_status.memory_size || 0}`;
-                    llmAvailableMain.textContent = 'Online';
-                    llmAvailableMain.className = 'text-2xl font-bold text-purple-400';
-                } else {
-                    llmStatus.innerHTML = '<div class="w-2 h-2 bg-red-400 rounded-full mr-2"></div><span class="text-sm">Offline</span>';
-                    llmDetails.textContent = status.dax_status?.error || 'AGI core not available';
-                    llmAvailableMain.textContent = 'Offline';
-                    llmAvailableMain.className = 'text-2xl font-bold text-red-400';
-                }
-                
-                // Update DAX health
-                document.getElementById('dax-health').textContent = status.dax_status?.status || 'Unknown';
-                
-                // Update autonomous status
-                const autoStatus = document.getElementById('autonomous-status');
-                if (status.autonomous) {
-                    autoStatus.innerHTML = '<div class="w-2 h-2 bg-green-400 rounded-full mr-2"></div><span class="text-sm">Active</span>';
-                } else {
-                    autoStatus.innerHTML = '<div class="w-2 h-2 bg-red-400 rounded-full mr-2"></div><span class="text-sm">Inactive</span>';
-                }
-                
-            } catch (error) {
-                console.error('Error updating status:', error);
-            }
-        }
-
-        // Update beliefs
-        async function updateBeliefs() {
-            try {
-                const response = await fetch('/api/beliefs');
-                const beliefs = await response.json();
-                
-                document.getElementById('confidence-main').textContent = beliefs.confidence.toFixed(3);
-                document.getElementById('sidebar-confidence').textContent = beliefs.confidence.toFixed(3);
-                document.getElementById('coherence-main').textContent = beliefs.coherence.toFixed(3);
-                document.getElementById('sidebar-coherence').textContent = beliefs.coherence.toFixed(3);
-                
-                // Update chart
-                if (beliefsChart) {
-                    const now = new Date().toLocaleTimeString();
-                    beliefsChart.data.labels.push(now);
-                    beliefsChart.data.datasets[0].data.push(beliefs.confidence);
-                    beliefsChart.data.datasets[1].data.push(beliefs.coherence);
-                    
-                    // Keep only last 20 points
-                    if (beliefsChart.data.labels.length > 20) {
-                        beliefsChart.data.labels.shift();
-                        beliefsChart.data.datasets[0].data.shift();
-                        beliefsChart.data.datasets[1].data.shift();
-                    }
-                    
-                    beliefsChart.update('none');
-                }
-                
-            } catch (error) {
-                console.error('Error updating beliefs:', error);
-            }
-        }
-
-        // Display results
-        function displayResults(results, input) {
-            const container = document.getElementById('results-container');
-            
-            let html = `<div class="bg-gray-700 rounded p-4">
-                <h3 class="font-semibold mb-2">Input: ${input}</h3>`;
-            
-            if (results.dax) {
-                if (results.dax.success) {
-                    html += `<div class="mt-3 p-3 bg-purple-900 rounded">
-                        <h4 class="font-semibold text-purple-300">AGI Analysis:</h4>
-                        <p class="text-sm mt-1">${results.dax.output}</p>
-                    </div>`;
-                } else {
-                    html += `<div class="mt-3 p-3 bg-red-900 rounded">
-                        <h4 class="font-semibold text-red-300">AGI Error:</h4>
-                        <p class="text-sm mt-1">${results.dax.error}</p>
-                    </div>`;
-                }
-            }
-            
-            if (results.mvts) {
-                if (results.mvts.success) {
-                    const mvts = results.mvts.result;
-                    html += `<div class="mt-3 p-3 bg-blue-900 rounded">
-                        <h4 class="font-semibold text-blue-300">MVTS Processing:</h4>
-                        <p class="text-sm mt-1">Success: ${mvts.success}</p>
-                        <p class="text-sm">Duration: ${mvts.duration.toFixed(3)}s</p>
-                        <p class="text-sm">Learning: ${mvts.learning.length > 0 ? mvts.learning.join(', ') : 'None'}</p>
-                    </div>`;
-                } else {
-                    html += `<div class="mt-3 p-3 bg-red-900 rounded">
-                        <h4 class="font-semibold text-red-300">MVTS Error:</h4>
-                        <p class="text-sm mt-1">${results.mvts.error}</p>
-                    </div>`;
-                }
-            }
-            
-            html += '</div>';
-            
-            container.innerHTML = html;
-        }
-
-        // Update loops
-        async function updateLoops() {
-            try {
-                const response = await fetch('/api/loops');
-                const data = await response.json();
-                
-                const loopsList = document.getElementById('loops-list');
-                if (data.recent_loops.length === 0) {
-                    loopsList.innerHTML = '<p class="text-gray-400">No loops processed yet</p>';
-                } else {
-                    loopsList.innerHTML = data.recent_loops.map(loop => `
-                        <div class="bg-gray-700 rounded p-3">
-                            <div class="flex justify-between items-center">
-                                <div>
-                                    <p class="font-semibold">${loop.goal.substring(0, 60)}${loop.goal.length > 60 ? '...' : ''}</p>
-                                    <p class="text-sm text-gray-400">ID: ${loop.loop_id} | Duration: ${loop.duration.toFixed(3)}s</p>
-                                </div>
-                                <div class="text-right">
-                                    <span class="px-2 py-1 rounded text-sm ${loop.success ? 'bg-green-600' : 'bg-red-600'}">
-                                        ${loop.success ? 'Success' : 'Failed'}
-                                    </span>
-                                </div>
-                            </div>
-                            ${loop.learning.length > 0 ? `
-                                <div class="mt-2">
-                                    <p class="text-sm text-gray-400">Learning:</p>
-                                    <ul class="text-sm text-gray-300 list-disc list-inside">
-                                        ${loop.learning.map(item => `<li>${item}</li>`).join('')}
-                                    </ul>
-                                </div>
-                            ` : ''}
-                        </div>
-                    `).join('');
-                }
-                
-            } catch (error) {
-                console.error('Error updating loops:', error);
-            }
-        }
-
-        function addLoopToUI(result, source) {
-            const loopsList = document.getElementById('loops-list');
-            const newLoop = document.createElement('div');
-            newLoop.className = 'bg-gray-700 rounded p-3 border-l-4 border-purple-500';
-            newLoop.innerHTML = `
-                <div class="flex justify-between items-center">
-                    <div>
-                        <p class="font-semibold">${result.goal.substring(0, 60)}${result.goal.length > 60 ? '...' : ''}</p>
-                        <p class="text-sm text-gray-400">ID: ${result.loop_id} | Source: ${source} | Duration: ${result.duration.toFixed(3)}s</p>
-                    </div>
-                    <div class="text-right">
-                        <span class="px-2 py-1 rounded text-sm ${result.success ? 'bg-green-600' : 'bg-red-600'}">
-                            ${result.success ? 'Success' : 'Failed'}
-                        </span>
-                    </div>
-                </div>
-            `;
-            
-            if (loopsList.firstChild?.classList?.contains('text-gray-400')) {
-                loopsList.removeChild(loopsList.firstChild);
-            }
-            
-            loopsList.insertBefore(newLoop, loopsList.firstChild);
-            
-            // Keep only last 10 loops
-            while (loopsList.children.length > 10) {
-                loopsList.removeChild(loopsList.lastChild);
-            }
-        }
-
-        // Processing functions
-        async function processIntegrated() {
-            const input = document.getElementById('input-text').value.trim();
-            if (!input) {
-                alert('Please enter input text');
-                return;
-            }
-            
-            try {
-                const response = await fetch('/api/integrated/process', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        input: input,
-                        use_mvts: true,
-                        use_dax: true,
-                        context: {}
-                    })
-                });
-                
-                const result = await response.json();
-                displayResults(result.results, result.input);
-                
-            } catch (error) {
-                console.error('Error processing integrated:', error);
-                alert('Error processing integrated request');
-            }
-        }
-
-        async function processDAXOnly() {
-            const input = document.getElementById('input-text').value.trim();
-            if (!input) {
-                alert('Please enter input text');
-                return;
-            }
-            
-            try {
-                const response = await fetch('/api/dax/process', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        input: input,
-                        quick_mode: true
-                    })
-                });
-                
-                const result = await response.json();
-                displayResults({ dax: { output: result.output, success: true } }, input);
-                
-            } catch (error) {
-                console.error('Error processing AGI:', error);
-                alert('Error processing AGI request');
-            }
-        }
+        pass
+    finally:
+        websocket_connections.discard(websocket)
+
+def _load_page(name: str) -> str:
+    """Load an HTML template and version its static asset URLs by content hash"""
+    with open(os.path.join(TEMPLATE_DIR, name), 'r') as f:
+        page = f.read()
+    
+    for asset in ("agi-dax.css", "msgpack-decode.js", "agi-dax.js"):
+        with open(os.path.join(STATIC_DIR, asset), 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()[:12]
+        page = page.replace(f"/static/{asset}", f"/static/{asset}?v={digest}")
+    return page
 
-        async function processMVTSOnly() {
-            const input = document.getElementById('input-text').value.trim();
-            if (!input) {
-                alert('Please enter input text');
-                return;
-            }
-            
-            try {
-                const response = await fetch('/api/mvts/process', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        goal: input,
-                        context: {},
-                        use_dax: false
-                    })
-                });
-                
-                const result = await response.json();
-                displayResults({ mvts: { result: result, success: true } }, input);
-                
-            } catch (error) {
-                console.error('Error processing MVTS:', error);
-                alert('Error processing MVTS request');
-        // Initialize
-        document.addEventListener('DOMContentLoaded', function() {
-           // Initialize WebSocket and start updates
-        initializeWebSocket();
-        setInterval(updateStatus, 5000);
-        setInterval(updateDAXLayers, 3000);
-        setInterval(updateBeliefsChart, 10000);
-        setInterval(updateWorldStats, 8000);
-        updateStatus();
-        updateDAXLayers();
-        updateBeliefsChart();
-        updateWorldStats();    
-            // Setup event listeners
-            document.getElementById('process-integrated').addEventListener('click', processIntegrated);
-            document.getElementById('process-dax-only').addEventListener('click', processDAXOnly);
-            document.getElementById('process-mvts-only').addEventListener('click', processMVTSOnly);
-            
-            // Sidebar buttons
-            document.getElementById('dax-quick-btn').addEventListener('click', processDAXOnly);
-            document.getElementById('mvts-btn').addEventListener('click', processIntegrated);
-            document.getElementById('integrated-btn').addEventListener('click', processIntegrated);
-            
-            // Auto-refresh
-            setInterval(() => {
-                updateStatus();
-                updateBeliefs();
-                updateLoops();
-                updateDAXLayers();
-            }, 3000);
-        });
-    </script>
-</body>
-</html>
-"""
+# Dashboard page, kept only as the encoded halves around the boot state;
+# CSS and JS are served from STATIC_DIR
+_HTML_HEAD, _HTML_TAIL = _load_page("agi-dax.html").encode("utf-8").split(b"__DAX_BOOT_STATE__")
 
 if __name__ == "__main__":
     print("Starting AGI DAX-MVTS Server...")
     print("Web Interface: http://localhost:8009")
     print("Features: AGI intelligence, DAX 13-layer governance, MVTS cognitive loops")
     print("Exhibits actual AGI-like behavior with intelligent processing")
-    uvicorn.run(app, host="0.0.0.0", port=8009, log_level="info")
+    # Each worker runs its own MVTS core, world simulation and WebSocket set, so
+    # dashboards on different workers diverge; keep one worker unless that is acceptable
+    workers = int(os.getenv("AGI_DAX_WORKERS", "1"))
+    # "auto" picks uvloop and httptools when they are installed
+    uvicorn.run("agi-dax-server:app" if workers > 1 else app, host="0.0.0.0", port=8009,
+                log_level=os.getenv("AGI_DAX_LOG_LEVEL", "info"), loop="auto", http="auto",
+                workers=workers, ws_per_message_deflate=True)
@@ -4,40 +4,106 @@ Standalone web server with sidebar governance panel and autonomous processing
 """
 
 import asyncio
-import json
+import hashlib
+import importlib.util
 import logging
+import threading
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
+from functools import lru_cache, wraps
+from typing import Dict, Any, Optional, Set
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from pydantic import BaseModel
+import numpy as np
+import orjson
 import uvicorn
-import threading
-import time
 import random
+import time
 import sys
 import os
 
-# Import MVTS and DAX components
-sys.path.append(os.path.dirname(__file__))
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
-
-# Load MVTS classes
-with open(os.path.join(os.path.dirname(__file__), 'mvts-core.py'), 'r') as f:
-    mvts_code = f.read()
-    exec(mvts_code)
+# Load MVTS classes as a real module so its bytecode is cached in __pycache__
+_mvts_spec = importlib.util.spec_from_file_location("mvts_core", os.path.join(os.path.dirname(__file__), 'mvts-core.py'))
+mvts_core_module = sys.modules.setdefault("mvts_core", importlib.util.module_from_spec(_mvts_spec))
+if not hasattr(mvts_core_module, "MVTSCore"):
+    _mvts_spec.loader.exec_module(mvts_core_module)
+MVTSCore = mvts_core_module.MVTSCore
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
-app = FastAPI(title="Autonomous MVTS Server")
+app = FastAPI(title="Autonomous MVTS Server", default_response_class=ORJSONResponse)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # Global instances
 mvts_core: Optional[MVTSCore] = None
 autonomous_running = False
-websocket_connections: List[WebSocket] = []
+# Each client has its own outbound queue, drained by a sender task
+websocket_connections: Dict[WebSocket, asyncio.Queue] = {}
+
+# Optional pub/sub URL (e.g. redis://localhost:6379) that fans broadcasts out
+# across uvicorn workers; without it broadcasts only reach this process's clients
+BROADCAST_URL = os.getenv("MVTS_BROADCAST_URL")
+BROADCAST_CHANNEL = "mvts"
+# Seconds to wait before resubscribing after the relay loses the broker
+RELAY_RETRY_DELAY = 5
+# Publishes still in flight, held so they are not garbage collected mid-send
+_publish_tasks: Set[asyncio.Task] = set()
+
+# Updates buffered per client; a client that falls further behind loses its oldest
+CLIENT_QUEUE_SIZE = 256
+
+# Autonomous cycles run when beliefs sag below these thresholds; otherwise only
+# after AUTONOMOUS_IDLE_LIMIT seconds without an autonomous cycle
+CONFIDENCE_THRESHOLD = 0.65
+COHERENCE_THRESHOLD = 0.75
+AUTONOMOUS_CHECK_INTERVAL = 30
+AUTONOMOUS_IDLE_LIMIT = 300
+
+# Timestamps shown in the UI only need ~100 ms resolution
+ISO_TICK = 0.1
+_iso_cache = ["", 0.0]
+
+def iso_now() -> str:
+    """Current local time in ISO format, reformatted at most once per ISO_TICK"""
+    now = time.time()
+    if now - _iso_cache[1] >= ISO_TICK:
+        _iso_cache[0] = datetime.fromtimestamp(now).isoformat()
+        _iso_cache[1] = now
+    return _iso_cache[0]
+
+# Seconds a status/beliefs snapshot is shared by every endpoint and the pusher
+SNAPSHOT_TTL = 0.5
+
+def ttl_cache(ttl: float):
+    """Memoize a zero-argument function for ttl seconds; .invalidate() forces a refresh"""
+    def decorator(fn):
+        cache = {"expires": 0.0, "value": None}
+
+        @wraps(fn)
+        def wrapper():
+            now = time.monotonic()
+            if now >= cache["expires"]:
+                cache["value"] = fn()
+                cache["expires"] = now + ttl
+            return cache["value"]
+
+        wrapper.invalidate = lambda: cache.update(expires=0.0)
+        return wrapper
+    return decorator
+
+@ttl_cache(SNAPSHOT_TTL)
+def cached_status() -> Dict[str, Any]:
+    """MVTS system status, recomputed at most once per SNAPSHOT_TTL"""
+    return mvts_core.get_system_status()
+
+@ttl_cache(SNAPSHOT_TTL)
+def cached_beliefs():
+    """Current belief state, reloaded at most once per SNAPSHOT_TTL"""
+    return mvts_core.state_store.get_beliefs()
 
 class GoalRequest(BaseModel):
     goal: str
@@ -59,17 +125,80 @@ async def startup_event():
             "rule_application_interval": 10
         })
         
-        # Start autonomous processing
+        # Cross-worker fanout: publish to the broker, deliver whatever it relays
+        if BROADCAST_URL:
+            from broadcaster import Broadcast
+            app.state.broadcast = Broadcast(BROADCAST_URL)
+            await app.state.broadcast.connect()
+            app.state.relay_task = asyncio.create_task(broadcast_relay())
+        
+        # Cognitive loops run one at a time on a worker thread with its own
+        # long-lived event loop; each one rewrites the state file, which would
+        # otherwise stall the server's loop
+        app.state.goal_loop = asyncio.new_event_loop()
+        app.state.goal_thread = threading.Thread(target=app.state.goal_loop.run_forever,
+                                                 name="mvts-goal", daemon=True)
+        app.state.goal_thread.start()
+
+        # Start autonomous processing on the server's own event loop; user
+        # goals set the wakeup event so belief drops are handled immediately
         autonomous_running = True
-        threading.Thread(target=autonomous_processor, daemon=True).start()
+        app.state.autonomous_wakeup = asyncio.Event()
+        app.state.auto_task = asyncio.create_task(autonomous_processor())
+        app.state.snapshot_task = asyncio.create_task(snapshot_pusher())
         
         logger.info("Autonomous MVTS Server initialized")
     except Exception as e:
         logger.error(f"Failed to initialize: {e}")
 
-def autonomous_processor():
-    """Background autonomous processing"""
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop autonomous processing"""
     global autonomous_running
+    autonomous_running = False
+    
+    for name in ("auto_task", "snapshot_task", "relay_task"):
+        task = getattr(app.state, name, None)
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    
+    broadcast = getattr(app.state, "broadcast", None)
+    if broadcast:
+        await broadcast.disconnect()
+
+    # Stop the goal loop once its current step ends; join without blocking this loop
+    goal_loop = getattr(app.state, "goal_loop", None)
+    if goal_loop:
+        goal_loop.call_soon_threadsafe(goal_loop.stop)
+        await asyncio.to_thread(app.state.goal_thread.join)
+        goal_loop.close()
+
+# Serializes cognitive loops; created on, and only used from, the goal loop's thread
+_goal_lock: Optional[asyncio.Lock] = None
+
+async def _process_goal_serialized(goal: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a cognitive loop on the goal loop, after any loop already in progress"""
+    global _goal_lock
+    if _goal_lock is None:
+        _goal_lock = asyncio.Lock()
+    async with _goal_lock:
+        return await mvts_core.process_goal(goal, context)
+
+async def run_goal(goal: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    """Process a goal off the event loop so requests and sockets stay responsive"""
+    future = asyncio.run_coroutine_threadsafe(_process_goal_serialized(goal, context), app.state.goal_loop)
+    result = await asyncio.wrap_future(future)
+    # The loop changed beliefs and history; don't serve the pre-goal snapshot
+    cached_status.invalidate()
+    cached_beliefs.invalidate()
+    return result
+
+async def autonomous_processor():
+    """Background autonomous processing"""
     
     autonomous_goals = [
         "Monitor system health and optimize performance",
@@ -79,73 +208,143 @@ def autonomous_processor():
         "Optimize learning parameters"
     ]
     
+    wakeup = app.state.autonomous_wakeup
+    last_cycle = time.monotonic()
+    
     while autonomous_running:
         try:
-            if mvts_core and random.random() < 0.3:  # 30% chance per cycle
+            # Sleep until a user goal lands or the check interval elapses
+            try:
+                await asyncio.wait_for(wakeup.wait(), AUTONOMOUS_CHECK_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            
+            if mvts_core and needs_autonomous_cycle(time.monotonic() - last_cycle):
+                # Cycles are awaited in turn, so they can never pile up
                 goal = random.choice(autonomous_goals)
+                result = await run_goal(goal, {"autonomous": True})
+                last_cycle = time.monotonic()
                 
-                # Run async function in thread
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                try:
-                    result = loop.run_until_complete(
-                        mvts_core.process_goal(goal, {"autonomous": True})
-                    )
-                    
-                    # Broadcast to websockets
-                    broadcast_update({
-                        "type": "autonomous_loop",
-                        "goal": goal,
-                        "result": result,
-                        "timestamp": datetime.now().isoformat()
-                    })
-                    
-                finally:
-                    loop.close()
-            
-            time.sleep(30)  # Check every 30 seconds
+                # Broadcast to websockets
+                broadcast_update({
+                    "type": "autonomous_loop",
+                    "goal": goal_preview(goal),
+                    "result": loop_summary(result),
+                    "timestamp": iso_now()
+                })
             
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error(f"Autonomous processor error: {e}")
-            time.sleep(60)
+            await asyncio.sleep(60)
+
+def needs_autonomous_cycle(idle_seconds: float) -> bool:
+    """Whether the current beliefs (or a long quiet spell) call for a cycle"""
+    beliefs = cached_beliefs()
+    return (
+        beliefs.confidence < CONFIDENCE_THRESHOLD
+        or beliefs.coherence < COHERENCE_THRESHOLD
+        or idle_seconds > AUTONOMOUS_IDLE_LIMIT
+    )
+
+# Clients only show a goal's first 50 characters and a handful of learning items;
+# anything longer is left to /api/loops/{loop_id}
+GOAL_PREVIEW_CHARS = 50
+MAX_LEARNING_ITEMS = 5
+LOOP_SUMMARY_FIELDS = ("loop_id", "goal", "success", "duration", "error")
+
+def goal_preview(goal: str) -> str:
+    """Goal text cut to what the UI displays"""
+    return goal[:GOAL_PREVIEW_CHARS] + "…" if len(goal) > GOAL_PREVIEW_CHARS else goal
+
+def loop_summary(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Strip a loop result down to the fields a broadcast renders"""
+    summary = {key: result[key] for key in LOOP_SUMMARY_FIELDS if key in result}
+    if "goal" in summary:
+        summary["goal"] = goal_preview(summary["goal"])
+    return summary
 
 def broadcast_update(message: Dict[str, Any]):
-    """Broadcast update to all WebSocket connections"""
-    if websocket_connections:
-        message_str = json.dumps(message)
-        disconnected = []
-        
-        for ws in websocket_connections:
-            try:
-                asyncio.run(ws.send_text(message_str))
-            except:
-                disconnected.append(ws)
-        
-        for ws in disconnected:
-            if ws in websocket_connections:
-                websocket_connections.remove(ws)
+    """Queue an update for every WebSocket connection, across workers when configured"""
+    broadcast = getattr(app.state, "broadcast", None)
+    if broadcast:
+        task = asyncio.create_task(broadcast.publish(channel=BROADCAST_CHANNEL, message=orjson.dumps(message).decode()))
+        _publish_tasks.add(task)
+        task.add_done_callback(_publish_done)
+    elif websocket_connections:
+        fanout_local(orjson.dumps(message).decode())
+
+def _publish_done(task: asyncio.Task):
+    """Forget a finished publish, logging it if it failed"""
+    _publish_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"Broadcast publish error: {task.exception()}")
+
+def fanout_local(message_str: str):
+    """Queue an encoded message for this process's WebSocket clients"""
+    # Encoded once; every client's queue shares the same string
+    for queue in websocket_connections.values():
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(message_str)
+
+async def broadcast_relay():
+    """Deliver messages published by any worker to this worker's clients"""
+    while True:
+        try:
+            async with app.state.broadcast.subscribe(channel=BROADCAST_CHANNEL) as subscriber:
+                async for event in subscriber:
+                    fanout_local(event.message)
+            logger.warning("Broadcast relay subscription ended; resubscribing")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Broadcast relay error: {e}")
+        await asyncio.sleep(RELAY_RETRY_DELAY)
+
+async def websocket_sender(websocket: WebSocket, queue: asyncio.Queue):
+    """Send a client's queued updates, batching everything available into one frame"""
+    try:
+        while True:
+            messages = [await queue.get()]
+            while not queue.empty():
+                messages.append(queue.get_nowait())
+            # Messages are already JSON; splice them into the batch envelope
+            await websocket.send_text('{"type": "batch", "events": [' + ",".join(messages) + "]}")
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        websocket_connections.pop(websocket, None)
 
 @app.get("/", response_class=HTMLResponse)
-async def home():
+async def home(request: Request):
     """Main MVTS web interface with DAX sidebar"""
-    return HTML_RESPONSE
+    headers = {"ETag": _HTML_ETAG, "Cache-Control": "public, max-age=300"}
+    if request.headers.get("if-none-match") == _HTML_ETAG:
+        return Response(status_code=304, headers=headers)
+    return Response(content=_HTML_BYTES, media_type="text/html", headers=headers)
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
+    return _health_payload()
+
+def _health_payload() -> Dict[str, Any]:
+    """Build the health payload"""
     if mvts_core:
-        status = mvts_core.get_system_status()
+        status = cached_status()
         return {
             "status": "healthy",
             "autonomous": autonomous_running,
             "mvts_status": status,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_now()
         }
     else:
         return {
             "status": "initializing",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_now()
         }
 
 @app.post("/api/goal")
@@ -155,15 +354,16 @@ async def process_goal(request: GoalRequest):
         raise HTTPException(status_code=503, detail="MVTS not initialized")
     
     try:
-        result = await mvts_core.process_goal(request.goal, request.context)
+        result = await run_goal(request.goal, request.context)
         
         # Broadcast update
         broadcast_update({
             "type": "user_goal",
-            "goal": request.goal,
-            "result": result,
-            "timestamp": datetime.now().isoformat()
+            "goal": goal_preview(request.goal),
+            "result": loop_summary(result),
+            "timestamp": iso_now()
         })
+        app.state.autonomous_wakeup.set()
         
         return result
     except Exception as e:
@@ -180,7 +380,7 @@ async def bt_query(request: BTRequest):
             "response": f"BT processed: {request.query}",
             "confidence": random.uniform(0.7, 0.95),
             "sources": ["source1", "source2", "source3"],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_now()
         }
         
         return bt_response
@@ -193,7 +393,7 @@ async def get_status():
     if not mvts_core:
         raise HTTPException(status_code=503, detail="MVTS not initialized")
     
-    return mvts_core.get_system_status()
+    return cached_status()
 
 @app.get("/api/loops")
 async def get_loops():
@@ -201,29 +401,48 @@ async def get_loops():
     if not mvts_core:
         raise HTTPException(status_code=503, detail="MVTS not initialized")
     
+    return _loops_payload()
+
+def _loops_payload() -> Dict[str, Any]:
+    """Build the cognitive loop history payload"""
     return {
         "active_loops": len(mvts_core.active_loops),
-        "completed_loops": len(mvts_core.loop_history),
+        "completed_loops": mvts_core.completed_loop_count,
         "recent_loops": [
             {
                 "loop_id": loop.loop_id,
-                "goal": loop.goal,
+                "goal": goal_preview(loop.goal),
                 "success": loop.success,
-                "learning": loop.learning,
+                "learning": loop.learning[:MAX_LEARNING_ITEMS],
                 "timestamp": loop.start_time,
                 "duration": mvts_core.calculate_duration(loop.start_time, loop.end_time)
             }
-            for loop in mvts_core.loop_history[-10:]
+            for loop in mvts_core.recent_loops(10)
         ]
     }
 
+@app.get("/api/loops/{loop_id}")
+async def get_loop(loop_id: str):
+    """Full detail for a loop still held in history"""
+    if not mvts_core:
+        raise HTTPException(status_code=503, detail="MVTS not initialized")
+    
+    for loop in mvts_core.recent_loops(len(mvts_core.loop_history)):
+        if loop.loop_id == loop_id:
+            return mvts_core.format_loop_result(loop)
+    raise HTTPException(status_code=404, detail="Loop not found")
+
 @app.get("/api/beliefs")
 async def get_beliefs():
     """Get current belief state"""
     if not mvts_core:
         raise HTTPException(status_code=503, detail="MVTS not initialized")
     
-    beliefs = mvts_core.state_store.get_beliefs()
+    return _beliefs_payload()
+
+def _beliefs_payload() -> Dict[str, Any]:
+    """Build the current belief state payload"""
+    beliefs = cached_beliefs()
     return {
         "coherence": beliefs.coherence,
         "reliability": beliefs.reliability,
@@ -232,46 +451,87 @@ async def get_beliefs():
         "last_updated": beliefs.last_updated
     }
 
+# Layer ids and names never change; only status and confidence are regenerated
+DAX_LAYER_NAMES = tuple(
+    (i, "DA-1 (Executor)" if i == 1 else "DA-13 (Sentinel)" if i == 13 else f"DA-{i}")
+    for i in range(13, 0, -1)
+)
+
+DAX_LAYER_STATUSES = ("active", "idle", "processing")
+
+# Seconds a generated DAX layer snapshot is served before it is rebuilt
+DAX_LAYERS_TTL = 2
+
+# Draws every layer's status and confidence in one vectorised call
+_dax_rng = np.random.default_rng()
+
+@lru_cache(maxsize=2)
+def _dax_layers_body(window: int) -> bytes:
+    """Serialized DAX layer snapshot, rebuilt once per DAX_LAYERS_TTL window"""
+    last_activity = iso_now()
+    statuses = _dax_rng.integers(0, len(DAX_LAYER_STATUSES), size=len(DAX_LAYER_NAMES)).tolist()
+    confidences = _dax_rng.uniform(0.7, 0.95, size=len(DAX_LAYER_NAMES)).tolist()
+    layers = [
+        {
+            "id": i,
+            "name": name,
+            "status": DAX_LAYER_STATUSES[status],
+            "confidence": confidence,
+            "last_activity": last_activity
+        }
+        for (i, name), status, confidence in zip(DAX_LAYER_NAMES, statuses, confidences)
+    ]
+    return orjson.dumps({"layers": layers})
+
 @app.get("/api/dax-layers")
 async def get_dax_layers():
     """Get DAX 13-layer governance status"""
-    layers = []
-    for i in range(13, 0, -1):
-        layer_name = f"DA-{i}"
-        if i == 1:
-            layer_name = "DA-1 (Executor)"
-        elif i == 13:
-            layer_name = "DA-13 (Sentinel)"
-        
-        layers.append({
-            "id": i,
-            "name": layer_name,
-            "status": random.choice(["active", "idle", "processing"]),
-            "confidence": random.uniform(0.7, 0.95),
-            "last_activity": datetime.now().isoformat()
-        })
-    
-    return {"layers": layers}
+    return Response(content=_dax_layers_body(int(time.time() // DAX_LAYERS_TTL)), media_type="application/json")
+
+# Seconds between dashboard snapshots pushed to WebSocket clients
+SNAPSHOT_INTERVAL = 5
+
+async def snapshot_pusher():
+    """Push one dashboard snapshot to every client instead of per-tab polling"""
+    while True:
+        await asyncio.sleep(SNAPSHOT_INTERVAL)
+        if not websocket_connections or not mvts_core:
+            continue
+        try:
+            # Snapshots describe this worker's own core, so they never go through the broker
+            fanout_local(orjson.dumps({
+                "type": "snapshot",
+                "status": _health_payload(),
+                "beliefs": _beliefs_payload(),
+                "loops": _loops_payload(),
+                "dax_layers": orjson.loads(_dax_layers_body(int(time.time() // DAX_LAYERS_TTL)))
+            }).decode())
+        except Exception as e:
+            logger.error(f"Snapshot pusher error: {e}")
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time updates"""
     await websocket.accept()
-    websocket_connections.append(websocket)
+    queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+    websocket_connections[websocket] = queue
+    sender = asyncio.create_task(websocket_sender(websocket, queue))
     
     try:
         while True:
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = orjson.loads(data)
             
             if message.get("type") == "ping":
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(orjson.dumps({
                     "type": "pong",
-                    "timestamp": datetime.now().isoformat()
-                }))
+                    "timestamp": iso_now()
+                }).decode())
     except WebSocketDisconnect:
-        if websocket in websocket_connections:
-            websocket_connections.remove(websocket)
+        pass
+    finally:
+        websocket_connections.pop(websocket, None)
+        sender.cancel()
 
 # Complete HTML Response with DAX Sidebar
 HTML_RESPONSE = """
@@ -438,12 +698,19 @@ HTML_RESPONSE = """
         }
 
         function handleWebSocketUpdate(data) {
-            if (data.type === 'autonomous_loop') {
+            // The server batches queued updates into one frame
+            if (data.type === 'batch') {
+                data.events.forEach(handleWebSocketUpdate);
+            } else if (data.type === 'autonomous_loop') {
                 addLoopToUI(data.result, 'Autonomous');
-                updateStatus();
             } else if (data.type === 'user_goal') {
                 addLoopToUI(data.result, 'User');
-                updateStatus();
+            } else if (data.type === 'snapshot') {
+                // Status follows from the pushed snapshot rather than a refetch per loop
+                renderStatus(data.status);
+                renderBeliefs(data.beliefs);
+                renderLoops(data.loops);
+                renderDAXLayers(data.dax_layers);
             }
         }
 
@@ -491,114 +758,119 @@ HTML_RESPONSE = """
         async function updateDAXLayers() {
             try {
                 const response = await fetch('/api/dax-layers');
-                const data = await response.json();
-                
-                const layersContainer = document.getElementById('dax-layers');
-                layersContainer.innerHTML = data.layers.map(layer => `
-                    <div class="layer-${layer.status} p-2 rounded text-xs">
-                        <div class="flex justify-between items-center">
-                            <span class="font-semibold">${layer.name}</span>
-                            <span class="opacity-75">${layer.confidence.toFixed(2)}</span>
-                        </div>
-                    </div>
-                `).join('');
+                renderDAXLayers(await response.json());
             } catch (error) {
                 console.error('Error updating DAX layers:', error);
             }
         }
 
+        function renderDAXLayers(data) {
+            const layersContainer = document.getElementById('dax-layers');
+            layersContainer.innerHTML = data.layers.map(layer => `
+                <div class="layer-${layer.status} p-2 rounded text-xs">
+                    <div class="flex justify-between items-center">
+                        <span class="font-semibold">${layer.name}</span>
+                        <span class="opacity-75">${layer.confidence.toFixed(2)}</span>
+                    </div>
+                </div>
+            `).join('');
+        }
+
         // Update status
         async function updateStatus() {
             try {
                 const response = await fetch('/health');
-                const status = await response.json();
-                
-                const completed = status.mvts_status?.completed_loops || 0;
-                document.getElementById('completed-loops-main').textContent = completed;
-                document.getElementById('completed-loops').textContent = completed;
-                document.getElementById('active-loops').textContent = status.mvts_status?.active_loops || 0;
-                document.getElementById('system-status').textContent = status.status || 'Unknown';
-                
-                // Update autonomous status
-                const autoStatus = document.getElementById('autonomous-status');
-                if (status.autonomous) {
-                    autoStatus.innerHTML = '<div class="w-2 h-2 bg-green-400 rounded-full mr-2"></div><span class="text-sm">Active</span>';
-                } else {
-                    autoStatus.innerHTML = '<div class="w-2 h-2 bg-red-400 rounded-full mr-2"></div><span class="text-sm">Inactive</span>';
-                }
-                
+                renderStatus(await response.json());
             } catch (error) {
                 console.error('Error updating status:', error);
             }
         }
 
+        function renderStatus(status) {
+            const completed = status.mvts_status?.completed_loops || 0;
+            document.getElementById('completed-loops-main').textContent = completed;
+            document.getElementById('completed-loops').textContent = completed;
+            document.getElementById('active-loops').textContent = status.mvts_status?.active_loops || 0;
+            document.getElementById('system-status').textContent = status.status || 'Unknown';
+            
+            // Update autonomous status
+            const autoStatus = document.getElementById('autonomous-status');
+            if (status.autonomous) {
+                autoStatus.innerHTML = '<div class="w-2 h-2 bg-green-400 rounded-full mr-2"></div><span class="text-sm">Active</span>';
+            } else {
+                autoStatus.innerHTML = '<div class="w-2 h-2 bg-red-400 rounded-full mr-2"></div><span class="text-sm">Inactive</span>';
+            }
+        }
+
         // Update beliefs
         async function updateBeliefs() {
             try {
                 const response = await fetch('/api/beliefs');
-                const beliefs = await response.json();
-                
-                document.getElementById('confidence-main').textContent = beliefs.confidence.toFixed(3);
-                document.getElementById('sidebar-confidence').textContent = beliefs.confidence.toFixed(3);
-                document.getElementById('coherence-main').textContent = beliefs.coherence.toFixed(3);
-                document.getElementById('sidebar-coherence').textContent = beliefs.coherence.toFixed(3);
-                
-                // Update chart
-                if (beliefsChart) {
-                    beliefsChart.data.datasets[0].data = [
-                        beliefs.coherence,
-                        beliefs.reliability,
-                        beliefs.learning_rate,
-                        beliefs.confidence
-                    ];
-                    beliefsChart.update();
-                }
-                
+                renderBeliefs(await response.json());
             } catch (error) {
                 console.error('Error updating beliefs:', error);
             }
         }
 
+        function renderBeliefs(beliefs) {
+            document.getElementById('confidence-main').textContent = beliefs.confidence.toFixed(3);
+            document.getElementById('sidebar-confidence').textContent = beliefs.confidence.toFixed(3);
+            document.getElementById('coherence-main').textContent = beliefs.coherence.toFixed(3);
+            document.getElementById('sidebar-coherence').textContent = beliefs.coherence.toFixed(3);
+            
+            // Update chart
+            if (beliefsChart) {
+                beliefsChart.data.datasets[0].data = [
+                    beliefs.coherence,
+                    beliefs.reliability,
+                    beliefs.learning_rate,
+                    beliefs.confidence
+                ];
+                beliefsChart.update();
+            }
+        }
+
         // Update loops
         async function updateLoops() {
             try {
                 const response = await fetch('/api/loops');
-                const data = await response.json();
-                
-                const loopsList = document.getElementById('loops-list');
-                if (data.recent_loops.length === 0) {
-                    loopsList.innerHTML = '<p class="text-gray-400">No loops processed yet</p>';
-                } else {
-                    loopsList.innerHTML = data.recent_loops.map(loop => `
-                        <div class="bg-gray-700 rounded p-3">
-                            <div class="flex justify-between items-center">
-                                <div>
-                                    <p class="font-semibold">${loop.goal.substring(0, 50)}${loop.goal.length > 50 ? '...' : ''}</p>
-                                    <p class="text-sm text-gray-400">ID: ${loop.loop_id} | Duration: ${loop.duration.toFixed(3)}s</p>
-                                </div>
-                                <div class="text-right">
-                                    <span class="px-2 py-1 rounded text-sm ${loop.success ? 'bg-green-600' : 'bg-red-600'}">
-                                        ${loop.success ? 'Success' : 'Failed'}
-                                    </span>
-                                </div>
-                            </div>
-                            ${loop.learning.length > 0 ? `
-                                <div class="mt-2">
-                                    <p class="text-sm text-gray-400">Learning:</p>
-                                    <ul class="text-sm text-gray-300 list-disc list-inside">
-                                        ${loop.learning.map(item => `<li>${item}</li>`).join('')}
-                                    </ul>
-                                </div>
-                            ` : ''}
-                        </div>
-                    `).join('');
-                }
-                
+                renderLoops(await response.json());
             } catch (error) {
                 console.error('Error updating loops:', error);
             }
         }
 
+        function renderLoops(data) {
+            const loopsList = document.getElementById('loops-list');
+            if (data.recent_loops.length === 0) {
+                loopsList.innerHTML = '<p class="text-gray-400">No loops processed yet</p>';
+            } else {
+                loopsList.innerHTML = data.recent_loops.map(loop => `
+                    <div class="bg-gray-700 rounded p-3">
+                        <div class="flex justify-between items-center">
+                            <div>
+                                <p class="font-semibold">${loop.goal.substring(0, 50)}${loop.goal.length > 50 ? '...' : ''}</p>
+                                <p class="text-sm text-gray-400">ID: ${loop.loop_id} | Duration: ${loop.duration.toFixed(3)}s</p>
+                            </div>
+                            <div class="text-right">
+                                <span class="px-2 py-1 rounded text-sm ${loop.success ? 'bg-green-600' : 'bg-red-600'}">
+                                    ${loop.success ? 'Success' : 'Failed'}
+                                </span>
+                            </div>
+                        </div>
+                        ${loop.learning.length > 0 ? `
+                            <div class="mt-2">
+                                <p class="text-sm text-gray-400">Learning:</p>
+                                <ul class="text-sm text-gray-300 list-disc list-inside">
+                                    ${loop.learning.map(item => `<li>${item}</li>`).join('')}
+                                </ul>
+                            </div>
+                        ` : ''}
+                    </div>
+                `).join('');
+            }
+        }
+
         function addLoopToUI(result, source) {
             const loopsList = document.getElementById('loops-list');
             const newLoop = document.createElement('div');
@@ -747,22 +1019,26 @@ HTML_RESPONSE = """
                     btQuery();
                 }
             });
-            
-            // Auto-refresh
-            setInterval(() => {
-                updateStatus();
-                updateBeliefs();
-                updateLoops();
-                updateDAXLayers();
-            }, 5000);
+            // Later updates arrive as WebSocket snapshots; no polling
         });
     </script>
 </body>
 </html>
 """
 
+# Encoded once; the page is static
+_HTML_BYTES = HTML_RESPONSE.encode("utf-8")
+_HTML_ETAG = '"%s"' % hashlib.md5(_HTML_BYTES).hexdigest()
+
 if __name__ == "__main__":
     print("Starting Autonomous MVTS Server...")
     print("Web Interface: http://localhost:8005")
     print("Features: DAX 13-layer sidebar, BT integration, autonomous processing")
-    uvicorn.run(app, host="0.0.0.0", port=8005, log_level="info")
+    # Each worker runs its own MVTS core and autonomous task against the same
+    # state file; keep one worker unless that is acceptable, and set
+    # MVTS_BROADCAST_URL so loop events reach clients on every worker
+    workers = int(os.getenv("AUTONOMOUS_MVTS_WORKERS", "1"))
+    # "auto" picks uvloop, httptools and websockets when they are installed
+    uvicorn.run("autonomous-mvts-server:app" if workers > 1 else app, host="0.0.0.0", port=8005,
+                log_level="info", loop="auto", http="auto", ws="auto",
+                workers=workers, ws_per_message_deflate=True)
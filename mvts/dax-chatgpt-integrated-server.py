@@ -343,7 +343,7 @@ async def get_loops():
     
     return {
         "active_loops": len(mvts_core.active_loops),
-        "completed_loops": len(mvts_core.loop_history),
+        "completed_loops": mvts_core.completed_loop_count,
         "recent_loops": [
             {
                 "loop_id": loop.loop_id,
@@ -353,7 +353,7 @@ async def get_loops():
                 "timestamp": loop.start_time,
                 "duration": mvts_core.calculate_duration(loop.start_time, loop.end_time)
             }
-            for loop in mvts_core.loop_history[-10:]
+            for loop in mvts_core.recent_loops(10)
         ]
     }
 
@@ -583,6 +583,21 @@ enta
         let beliefsChart = null;
         let ws = null;
 
+        // Belief readouts, looked up once; the script runs after the markup
+        const confidenceEls = ['confidence-main', 'sidebar-confidence'].map(id => document.getElementById(id)).filter(Boolean);
+        const coherenceEls = ['coherence-main', 'sidebar-coherence'].map(id => document.getElementById(id)).filter(Boolean);
+
+        // Chart labels share one formatter; toLocaleTimeString builds a new one per call
+        const timeFormat = new Intl.DateTimeFormat(undefined, { hour: 'numeric', minute: 'numeric', second: 'numeric' });
+
+        // Fixed-size ring buffer backing the beliefs chart
+        const CHART_POINTS = 20;
+        const chartLabels = new Array(CHART_POINTS);
+        const confidenceBuf = new Float32Array(CHART_POINTS);
+        const coherenceBuf = new Float32Array(CHART_POINTS);
+        let chartHead = 0;
+        let chartCount = 0;
+
         // Initialize WebSocket
         function initWebSocket() {
             const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
@@ -741,33 +756,43 @@ enta
                 const response = await fetch('/api/beliefs');
                 const beliefs = await response.json();
                 
-                document.getElementById('confidence-main').textContent = beliefs.confidence.toFixed(3);
-                document.getElementById('sidebar-confidence').textContent = beliefs.confidence.toFixed(3);
-                document.getElementById('coherence-main').textContent = beliefs.coherence.toFixed(3);
-                document.getElementById('sidebar-coherence').textContent = beliefs.coherence.toFixed(3);
+                // Record the point; overwriting the oldest slot once full
+                chartLabels[chartHead] = timeFormat.format(new Date());
+                confidenceBuf[chartHead] = beliefs.confidence;
+                coherenceBuf[chartHead] = beliefs.coherence;
+                chartHead = (chartHead + 1) % CHART_POINTS;
+                chartCount = Math.min(chartCount + 1, CHART_POINTS);
                 
-                // Update chart
-                if (beliefsChart) {
-                    const now = new Date().toLocaleTimeString();
-                    beliefsChart.data.labels.push(now);
-                    beliefsChart.data.datasets[0].data.push(beliefs.confidence);
-                    beliefsChart.data.datasets[1].data.push(beliefs.coherence);
+                // Apply readouts and chart together in one frame
+                requestAnimationFrame(() => {
+                    const confidence = beliefs.confidence.toFixed(3);
+                    const coherence = beliefs.coherence.toFixed(3);
+                    confidenceEls.forEach(el => { el.textContent = confidence; });
+                    coherenceEls.forEach(el => { el.textContent = coherence; });
                     
-                    // Keep only last 20 points
-                    if (beliefsChart.data.labels.length > 20) {
-                        beliefsChart.data.labels.shift();
-                        beliefsChart.data.datasets[0].data.shift();
-                        beliefsChart.data.datasets[1].data.shift();
+                    // Update chart
+                    if (beliefsChart) {
+                        copyRing(chartLabels, beliefsChart.data.labels);
+                        copyRing(confidenceBuf, beliefsChart.data.datasets[0].data);
+                        copyRing(coherenceBuf, beliefsChart.data.datasets[1].data);
+                        beliefsChart.update('none');
                     }
-                    
-                    beliefsChart.update('none');
-                }
+                });
                 
             } catch (error) {
                 console.error('Error updating beliefs:', error);
             }
         }
 
+        // Copy the ring into the chart's own array, oldest first, without reallocating it
+        function copyRing(buf, out) {
+            const start = chartCount < CHART_POINTS ? 0 : chartHead;
+            out.length = chartCount;
+            for (let i = 0; i < chartCount; i++) {
+                out[i] = buf[(start + i) % CHART_POINTS];
+            }
+        }
+
         // Display results
         function displayResults(results, input) {
             const container = document.getElementById('results-container');
@@ -113,7 +113,7 @@ async def get_loops():
     
     return {
         "active_loops": len(mvts_core.active_loops),
-        "completed_loops": len(mvts_core.loop_history),
+        "completed_loops": mvts_core.completed_loop_count,
         "recent_loops": [
             {
                 "loop_id": loop.loop_id,
@@ -123,7 +123,7 @@ async def get_loops():
                 "timestamp": loop.start_time,
                 "duration": mvts_core.calculate_duration(loop.start_time, loop.end_time)
             }
-            for loop in mvts_core.loop_history[-10:]  # Last 10 loops
+            for loop in mvts_core.recent_loops(10)  # Last 10 loops
         ]
     }
 
@@ -6,17 +6,23 @@ Integrates cognitive modules for persistent learning and closed-loop reasoning
 import json
 import asyncio
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 import uuid
 import os
+import sys
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Loop records are created per goal and kept in history; slots drop the
+# per-instance __dict__ on interpreters that support slotted dataclasses
+record = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+@record
 class BeliefState:
     """System belief state for MVTS"""
     coherence: float = 0.8
@@ -25,7 +31,7 @@ class BeliefState:
     confidence: float = 0.7
     last_updated: str = ""
 
-@dataclass
+@record
 class CognitivePhase:
     """Single phase in cognitive loop"""
     phase_id: str
@@ -36,7 +42,7 @@ class CognitivePhase:
     output: Dict[str, Any] = None
     learning: List[str] = None
 
-@dataclass
+@record
 class CognitiveLoop:
     """Complete cognitive loop with multiple phases"""
     loop_id: str
@@ -47,6 +53,7 @@ class CognitiveLoop:
     end_time: Optional[str] = None
     success: bool = False
     learning: List[str] = None
+    duration: float = 0.0
     
     def __post_init__(self):
         if self.learning is None:
@@ -55,8 +62,11 @@ class CognitiveLoop:
 class StateStore:
     """Persistent state storage for MVTS"""
     
-    def __init__(self, storage_path: str = "./mvts-state.json"):
+    def __init__(self, storage_path: str = "./mvts-state.json", defer_writes: bool = False):
         self.storage_path = storage_path
+        # Deferred stores only mark changes; the owner calls flush() periodically
+        self.defer_writes = defer_writes
+        self.dirty = False
         self.state = {
             "beliefs": asdict(BeliefState()),
             "memory": [],
@@ -78,13 +88,39 @@ class StateStore:
     
     def save_state(self):
         """Save state to storage"""
+        self.state["last_updated"] = datetime.now().isoformat()
+        self._write_state(self.state)
+    
+    def _write_state(self, state: Dict[str, Any]) -> bool:
+        """Write a state dict to storage; returns whether the write succeeded"""
         try:
-            self.state["last_updated"] = datetime.now().isoformat()
             with open(self.storage_path, 'w') as f:
-                json.dump(self.state, f, indent=2)
+                json.dump(state, f, indent=2)
             logger.info(f"State saved to {self.storage_path}")
+            return True
         except Exception as e:
             logger.error(f"Failed to save state: {e}")
+            return False
+    
+    def mark_changed(self):
+        """Save now, or leave the change for flush() when writes are deferred"""
+        if self.defer_writes:
+            self.dirty = True
+        else:
+            self.save_state()
+    
+    async def flush(self):
+        """Write deferred changes from a worker thread"""
+        if not self.dirty:
+            return
+        # Cleared before the snapshot so changes made during the write stay marked
+        self.dirty = False
+        self.state["last_updated"] = datetime.now().isoformat()
+        # Memory entries are never mutated once added, so a shallow copy is a stable snapshot
+        snapshot = {**self.state, "memory": list(self.state["memory"])}
+        if not await asyncio.get_running_loop().run_in_executor(None, self._write_state, snapshot):
+            # Keep the changes pending so the next flush retries them
+            self.dirty = True
     
     def get_beliefs(self) -> BeliefState:
         """Get current belief state"""
@@ -95,7 +131,7 @@ class StateStore:
         """Update belief state"""
         beliefs.last_updated = datetime.now().isoformat()
         self.state["beliefs"] = asdict(beliefs)
-        self.save_state()
+        self.mark_changed()
     
     def add_memory(self, memory: Dict[str, Any]):
         """Add memory to storage"""
@@ -103,7 +139,7 @@ class StateStore:
             **memory,
             "timestamp": datetime.now().isoformat()
         })
-        self.save_state()
+        self.mark_changed()
     
     def get_recent_memories(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent memories"""
@@ -209,14 +245,16 @@ class MVTSCore:
         
         # Initialize modules
         storage_path = self.config.get("storage_path", "./mvts-state.json")
-        self.state_store = StateStore(storage_path)
+        self.state_store = StateStore(storage_path, self.config.get("defer_state_writes", False))
         self.planner = Planner(self.state_store)
         self.outcome_evaluator = OutcomeEvaluator(self.state_store)
         self.update_rules = UpdateRules(self.state_store)
         
         # System state
         self.active_loops: Dict[str, CognitiveLoop] = {}
-        self.loop_history: List[CognitiveLoop] = []
+        # History is bounded; the total count survives eviction of old loops
+        self.loop_history: Deque[CognitiveLoop] = deque(maxlen=self.config.get("loop_history_limit", 1000))
+        self.completed_loop_count = 0
         
         # Auto-apply rules
         if self.config.get("auto_apply_rules", True):
@@ -262,11 +300,13 @@ class MVTSCore:
             
             # Complete loop
             loop.end_time = datetime.now().isoformat()
+            loop.duration = self.calculate_duration(loop.start_time, loop.end_time)
             loop.success = all(phase.success for phase in loop.phases)
             loop.learning = update_phase.output.get("learning_updates", [])
             
             # Move to history
             self.loop_history.append(loop)
+            self.completed_loop_count += 1
             del self.active_loops[loop_id]
             
             # Add to memory
@@ -284,6 +324,7 @@ class MVTSCore:
             logger.error(f"Error in cognitive loop {loop_id}: {e}")
             loop.success = False
             loop.end_time = datetime.now().isoformat()
+            loop.duration = self.calculate_duration(loop.start_time, loop.end_time)
             return {"error": str(e), "loop_id": loop_id}
     
     async def execute_plan_phase(self, goal: str, context: Dict[str, Any]) -> CognitivePhase:
@@ -406,7 +447,7 @@ class MVTSCore:
             "loop_id": loop.loop_id,
             "goal": loop.goal,
             "success": loop.success,
-            "duration": self.calculate_duration(loop.start_time, loop.end_time),
+            "duration": loop.duration,
             "phases_completed": len(loop.phases),
             "learning": loop.learning,
             "final_beliefs": asdict(self.state_store.get_beliefs()),
@@ -432,13 +473,18 @@ class MVTSCore:
         except:
             return 0.0
     
+    def recent_loops(self, limit: int = 10) -> List[CognitiveLoop]:
+        """Most recent completed loops, oldest first"""
+        history = self.loop_history
+        return [history[-i] for i in range(min(limit, len(history)), 0, -1)]
+    
     def get_system_status(self) -> Dict[str, Any]:
         """Get current system status"""
         beliefs = self.state_store.get_beliefs()
         
         return {
             "active_loops": len(self.active_loops),
-            "completed_loops": len(self.loop_history),
+            "completed_loops": self.completed_loop_count,
             "current_beliefs": asdict(beliefs),
             "memory_size": len(self.state_store.state.get("memory", [])),
             "system_uptime": "N/A",  # Could track actual uptime
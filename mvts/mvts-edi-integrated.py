@@ -216,7 +216,7 @@ async def get_cognitive_loops():
     
     return {
         "active_loops": len(mvts_core.active_loops),
-        "completed_loops": len(mvts_core.loop_history),
+        "completed_loops": mvts_core.completed_loop_count,
         "recent_loops": [
             {
                 "loop_id": loop.loop_id,
@@ -225,7 +225,7 @@ async def get_cognitive_loops():
                 "learning": loop.learning,
                 "timestamp": loop.start_time
             }
-            for loop in mvts_core.loop_history[-5:]  # Last 5 loops
+            for loop in mvts_core.recent_loops(5)  # Last 5 loops
         ]
     }
 
@@ -0,0 +1,871 @@
+let beliefsChart = null;
+let ws = null;
+let decodeFrame = null;
+
+// Fixed-size ring buffer backing the beliefs chart
+const CHART_POINTS = 20;
+const chartLabels = new Array(CHART_POINTS);
+const confidenceBuf = new Float32Array(CHART_POINTS);
+const coherenceBuf = new Float32Array(CHART_POINTS);
+let chartHead = 0;
+let chartCount = 0;
+let chartFrame = null;
+let chartDirty = false;
+let chartInView = false;
+
+// Chart labels share one formatter; toLocaleTimeString builds a new one per call
+const timeFormat = new Intl.DateTimeFormat(undefined, { hour: 'numeric', minute: 'numeric', second: 'numeric' });
+
+// Initialize WebSocket
+function initWebSocket() {
+    const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+    ws = new WebSocket(`${protocol}//${window.location.host}/ws`);
+    ws.binaryType = 'arraybuffer';
+
+    ws.onopen = function() {
+        console.log('WebSocket connected');
+    };
+
+    ws.onmessage = function(event) {
+        // State updates arrive as MessagePack frames; control replies stay JSON text
+        const data = typeof event.data === 'string'
+            ? JSON.parse(event.data)
+            : decodeFrame(new Uint8Array(event.data));
+        // The server batches pushes; each frame may carry several messages
+        if (data.batch) {
+            data.batch.forEach(handleWebSocketUpdate);
+        } else {
+            handleWebSocketUpdate(data);
+        }
+    };
+
+    ws.onclose = function() {
+        console.log('WebSocket disconnected');
+        setTimeout(initWebSocket, 3000);
+    };
+}
+
+// Coalesce DOM work into a single animation frame
+let pendingUpdate = null;
+// Only the newest payload per state type survives until the frame
+const pendingState = new Map();
+let pendingLoops = [];
+let pendingResults = null;
+let lastResultTimestamp = null;
+
+// Bursty pushes render at most ~30 times a second
+const FLUSH_INTERVAL_MS = 33;
+let lastFlush = 0;
+
+function scheduleUpdate(fn) {
+    if (pendingUpdate) {
+        return;
+    }
+    const wait = Math.max(0, lastFlush + FLUSH_INTERVAL_MS - performance.now());
+    pendingUpdate = setTimeout(() => requestAnimationFrame(() => {
+        pendingUpdate = null;
+        lastFlush = performance.now();
+        fn();
+    }), wait);
+}
+
+// Client copy of the loops payload; full snapshots replace it, deltas patch it
+let loopsState = null;
+
+function applyLoopsMessage(data) {
+    if (data.type === 'loops') {
+        loopsState = data.data;
+    } else if (loopsState) {
+        const known = new Map(loopsState.recent_loops.map(loop => [loop.loop_id, loop]));
+        data.data.added.forEach(loop => known.set(loop.loop_id, loop));
+        loopsState = {
+            active_loops: data.data.active_loops,
+            completed_loops: data.data.completed_loops,
+            recent_loops: data.data.ids.map(id => known.get(id)).filter(Boolean)
+        };
+    }
+    return loopsState;
+}
+
+// Hash of the last accepted payload per state type; repeats skip all UI work
+const lastStateHash = {};
+
+function unchangedState(type, payload) {
+    // Timestamps alone do not count as a change
+    const { timestamp, ...rest } = payload;
+    const hash = hashStr(JSON.stringify(rest));
+    if (lastStateHash[type] === hash) {
+        return true;
+    }
+    lastStateHash[type] = hash;
+    return false;
+}
+
+function handleWebSocketUpdate(data) {
+    // Loop deltas patch the model even while hidden so later deltas still apply
+    if (data.type === 'loops' || data.type === 'loops_delta') {
+        const loops = applyLoopsMessage(data);
+        if (!loops) {
+            return;
+        }
+        data = { type: 'loops', data: loops };
+    }
+    // A hidden tab renders nothing; refresh() resyncs it on return
+    if (document.hidden && data.type !== 'integrated_process') {
+        return;
+    }
+    if (data.type === 'autonomous_loop' || data.type === 'mvts_loop') {
+        pendingLoops.push(data);
+    } else if (data.type === 'integrated_process') {
+        pendingResults = data;
+    } else if (data.type in stateRenderers) {
+        if (unchangedState(data.type, data.data)) {
+            return;
+        }
+        pendingState.set(data.type, data.data);
+    } else {
+        return;
+    }
+    scheduleUpdate(flushWebSocketUpdates);
+}
+
+function flushWebSocketUpdates() {
+    const loops = pendingLoops;
+    pendingLoops = [];
+    loops.forEach(data => addLoopToUI(data.result, data.type === 'autonomous_loop' ? 'Autonomous' : 'User'));
+
+    // The broadcast echo of our own request carries the same timestamp
+    if (pendingResults && !(pendingResults.timestamp && pendingResults.timestamp === lastResultTimestamp)) {
+        lastResultTimestamp = pendingResults.timestamp;
+        displayResults(pendingResults.results, pendingResults.input);
+    }
+    pendingResults = null;
+    pendingState.forEach((payload, type) => stateRenderers[type](payload));
+    pendingState.clear();
+}
+
+// Performance mode toggle
+const perfToggle = document.getElementById('perf-mode-toggle');
+perfToggle.checked = document.body.classList.contains('perf-mode');
+perfToggle.addEventListener('change', function() {
+    document.body.classList.toggle('perf-mode', perfToggle.checked);
+    localStorage.setItem('perfMode', perfToggle.checked ? '1' : '0');
+});
+
+// Stop polling while hidden; resync and resume animations when the tab comes back
+document.addEventListener('visibilitychange', function() {
+    document.body.classList.toggle('paused', document.hidden);
+    if (document.hidden) {
+        stopTimers();
+    } else {
+        startTimers();
+        refresh();
+    }
+});
+
+// Pages kept in the back/forward cache must not keep polling
+window.addEventListener('pagehide', stopTimers);
+window.addEventListener('pageshow', function(event) {
+    if (event.persisted) {
+        startTimers();
+        refresh();
+    }
+});
+
+// Pause sidebar animations while the sidebar is off screen (mobile)
+const sidebarObserver = new IntersectionObserver(([entry]) => {
+    entry.target.classList.toggle('paused', !entry.isIntersecting);
+});
+sidebarObserver.observe(document.getElementById('sidebar'));
+
+// Mobile menu toggle
+document.getElementById('menu-toggle').addEventListener('click', function() {
+    document.getElementById('sidebar').classList.toggle('open');
+});
+
+// Initialize chart
+function initChart(Chart) {
+    const ctx = document.getElementById('beliefs-chart').getContext('2d');
+    beliefsChart = new Chart(ctx, {
+        type: 'line',
+        data: {
+            labels: [],
+            datasets: [
+                {
+                    label: 'Confidence',
+                    data: [],
+                    borderColor: 'rgb(139, 92, 246)',
+                    backgroundColor: 'rgba(139, 92, 246, 0.1)',
+                    tension: 0.4
+                },
+                {
+                    label: 'Coherence',
+                    data: [],
+                    borderColor: 'rgb(59, 130, 246)',
+                    backgroundColor: 'rgba(59, 130, 246, 0.1)',
+                    tension: 0.4
+                }
+            ]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            animation: false,
+            scales: {
+                y: { 
+                    min: 0, 
+                    max: 1,
+                    grid: { color: 'rgba(255, 255, 255, 0.1)' },
+                    ticks: { color: 'white' }
+                },
+                x: { 
+                    grid: { color: 'rgba(255, 255, 255, 0.1)' },
+                    ticks: { color: 'white' }
+                }
+            },
+            plugins: {
+                legend: { labels: { color: 'white' } },
+                decimation: { enabled: true, algorithm: 'min-max' }
+            }
+        }
+    });
+}
+
+// Update DAX layers
+// Persistent layer rows keyed by layer name: {root, status, bar}
+const layerNodes = new Map();
+
+function initDAXLayers(names) {
+    const container = document.getElementById('dax-layers');
+    const frag = document.createDocumentFragment();
+
+    names.forEach(name => {
+        const root = document.createElement('div');
+        root.className = 'layer-visualization layer-idle';
+        root.innerHTML = `
+            <div class="flex justify-between items-center mb-1">
+                <span class="text-xs font-semibold"></span>
+                <span class="text-xs opacity-75"></span>
+            </div>
+            <div class="layer-bar">
+                <div class="layer-progress"></div>
+            </div>
+        `;
+        const [label, status] = root.querySelectorAll('span');
+        label.textContent = name;
+        layerNodes.set(name, { root, status, bar: root.querySelector('.layer-progress') });
+        frag.appendChild(root);
+    });
+    container.replaceChildren(frag);
+}
+
+function updateDAXLayers(data) {
+    // Rows are built once; a different layer set rebuilds them
+    if (data.layers.length !== layerNodes.size || !data.layers.every(layer => layerNodes.has(layer.name))) {
+        layerNodes.clear();
+        initDAXLayers(data.layers.map(layer => layer.name));
+    }
+
+    data.layers.forEach(layer => {
+        const n = layerNodes.get(layer.name);
+        if (n.root.dataset.status !== layer.status) {
+            n.root.dataset.status = layer.status;
+            n.root.className = `layer-visualization ${layer.status === 'active' ? 'layer-active' : layer.status === 'processing' ? 'layer-processing' : 'layer-idle'}`;
+            n.status.textContent = layer.status.toUpperCase();
+        }
+
+        // Identical state leaves the bar untouched so nothing is repainted
+        const progress = layerProgress(layer);
+        if (n.root.dataset.progress !== String(progress)) {
+            n.root.dataset.progress = String(progress);
+            n.bar.style.transform = `scaleX(${progress / 100})`;
+        }
+    });
+}
+
+// Server-reported progress, or a deterministic stand-in derived from the name
+function layerProgress(layer) {
+    if (typeof layer.progress === 'number') {
+        return layer.progress;
+    }
+    return layer.status === 'processing' ? 40 + (hashStr(layer.name) % 30) : (layer.status === 'active' ? 100 : 0);
+}
+
+function hashStr(str) {
+    let hash = 0;
+    for (let i = 0; i < str.length; i++) {
+        hash = (hash * 31 + str.charCodeAt(i)) | 0;
+    }
+    return Math.abs(hash);
+}
+
+function renderWorldStats(stats) {
+    document.getElementById('world-population').textContent = 
+        (stats.total_population / 1_000_000_000).toFixed(1) + 'B';
+    document.getElementById('world-gdp').textContent = 
+        '$' + (stats.global_gdp_trillion_usd).toFixed(0) + 'T';
+    document.getElementById('world-happiness').textContent = 
+        stats.happiness_index.toFixed(2);
+    document.getElementById('world-renewable').textContent = 
+        stats.renewable_energy_percent.toFixed(0) + '%';
+}
+
+// World simulation event handlers
+document.getElementById('world-simulate-btn').addEventListener('click', async () => {
+    try {
+        const response = await fetch('/api/world/simulate', { method: 'POST' });
+        const result = await response.json();
+
+        // Update world stats after simulation
+        await refresh();
+
+        // Show simulation results
+        addResultEntry('world', `Day ${result.date} simulated. Population: ${result.population.toLocaleString()}, Events: ${result.events.length}`);
+    } catch (error) {
+        console.error('World simulation error:', error);
+    }
+});
+
+// The policy form is a modal dialog so the page keeps rendering while it is open
+const policyDialog = document.getElementById('policy-dialog');
+
+document.getElementById('world-policy-btn').addEventListener('click', () => {
+    policyDialog.showModal();
+});
+
+policyDialog.addEventListener('close', async () => {
+    if (policyDialog.returnValue !== 'apply') {
+        return;
+    }
+    const form = new FormData(document.getElementById('policy-form'));
+    const policyType = form.get('type');
+    try {
+        const response = await fetch('/api/world/policy', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                type: policyType,
+                magnitude: parseFloat(form.get('magnitude')),
+                duration: parseInt(form.get('duration'), 10)
+            })
+        });
+        const result = await response.json();
+
+        // Update world stats after policy
+        await refresh();
+
+        // Show policy effects
+        const effects = Object.entries(result.effects).map(([k, v]) => `${k}: ${(v * 100).toFixed(1)}%`).join(', ');
+        addResultEntry('world', `Policy applied: ${policyType}. Effects: ${effects}`);
+    } catch (error) {
+        console.error('Policy application error:', error);
+    }
+});
+
+function renderPolicyProgress(data) {
+    const bar = document.getElementById('policy-progress');
+    bar.value = data.pct;
+    bar.hidden = data.pct >= 100;
+}
+
+document.getElementById('world-export-btn').addEventListener('click', async () => {
+    try {
+        const response = await fetch('/api/world/export?format=json');
+        const result = await response.json();
+
+        // Create downloadable file
+        const blob = new Blob([result.data], { type: 'application/json' });
+        const url = URL.createObjectURL(blob);
+        const a = document.createElement('a');
+        a.href = url;
+        a.download = `world-simulation-${new Date().toISOString().split('T')[0]}.json`;
+        a.click();
+        URL.revokeObjectURL(url);
+
+        addResultEntry('world', 'World simulation data exported successfully');
+    } catch (error) {
+        console.error('Export error:', error);
+    }
+});
+
+// At most one request per key: a newer call aborts the stale one
+const controllers = {};
+// Last ETag seen per key; an unchanged resource comes back as an empty 304
+const etags = {};
+
+function pollingFetch(key, url, opts = {}) {
+    controllers[key]?.abort();
+    const controller = new AbortController();
+    controllers[key] = controller;
+    const headers = etags[key] ? { ...opts.headers, 'If-None-Match': etags[key] } : opts.headers;
+    return fetch(url, { ...opts, headers, cache: 'no-store', signal: controller.signal })
+        .then(response => {
+            if (response.status === 304) {
+                return null;
+            }
+            etags[key] = response.headers.get('ETag');
+            return response.json();
+        })
+        .catch(error => {
+            if (error.name !== 'AbortError') {
+                throw error;
+            }
+            return null;
+        });
+}
+
+// Pull every dashboard payload in one request and render it like a push
+async function refresh() {
+    try {
+        const snapshot = await pollingFetch('dashboard', '/api/dashboard');
+        if (!snapshot) {
+            return;
+        }
+        Object.entries(snapshot).forEach(([type, data]) => handleWebSocketUpdate({ type, data }));
+    } catch (error) {
+        console.error('Error refreshing dashboard:', error);
+    }
+}
+
+// Polling fallback: one timer walks a due-time table instead of a timer per endpoint
+const schedule = [
+    // Stand in for pushes while the WebSocket is down
+    { fn: refresh, interval: 5000, next: 5000, offlineOnly: true },
+    // Heartbeat resync: corrects any drift a dropped push left behind
+    { fn: refresh, interval: 30000, next: 30000, offlineOnly: false }
+];
+
+function socketOpen() {
+    return ws !== null && ws.readyState === WebSocket.OPEN;
+}
+
+// Self-rescheduling: the next tick is armed only after this one's fetch settles,
+// so a slow response or busy main thread can never queue a backlog of ticks
+async function tick(generation) {
+    const now = performance.now();
+    const online = socketOpen();
+    for (const entry of schedule) {
+        if (now < entry.next || (entry.offlineOnly && online)) {
+            continue;
+        }
+        entry.next = now + entry.interval;
+        // One refresh covers every entry due this tick
+        schedule.forEach(other => { other.next = Math.max(other.next, now + other.interval); });
+        await entry.fn();
+        break;
+    }
+    if (generation === schedulerGeneration) {
+        scheduleTimer = setTimeout(tick, 1000, generation);
+    }
+}
+
+let scheduleTimer = null;
+// Bumped on every start/stop so a tick still awaiting its fetch does not re-arm
+let schedulerGeneration = 0;
+
+function startTimers() {
+    if (scheduleTimer === null && !document.hidden) {
+        schedulerGeneration++;
+        scheduleTimer = setTimeout(tick, 1000, schedulerGeneration);
+    }
+}
+
+function stopTimers() {
+    schedulerGeneration++;
+    clearTimeout(scheduleTimer);
+    scheduleTimer = null;
+}
+
+function renderStatus(status) {
+    const stats = status.stats || {};
+    const components = status.components || {};
+    const healthy = status.status === 'healthy';
+
+    // Update system status
+    document.getElementById('system-status').textContent = healthy ? 'AGI Active' : 'Unknown';
+    document.getElementById('completed-loops-main').textContent = stats.completed_loops || 0;
+    document.getElementById('completed-loops').textContent = stats.completed_loops || 0;
+    document.getElementById('active-loops').textContent = stats.active_loops || 0;
+
+    // Update AGI status
+    const llmStatus = document.getElementById('llm-status');
+    const llmDetails = document.getElementById('llm-details');
+    const llmAvailableMain = document.getElementById('llm-available');
+
+    if (healthy && components.dax) {
+        llmStatus.innerHTML = '<div class="w-2 h-2 bg-purple-400 rounded-full mr-2 agi-pulse"></div><span class="text-sm">Active</span>';
+        llmDetails.textContent = `Model: agi-local | Memory: ${stats.memories || 0}`;
+        llmAvailableMain.textContent = 'Online';
+        llmAvailableMain.className = 'text-2xl font-bold text-purple-400';
+    } else {
+        llmStatus.innerHTML = '<div class="w-2 h-2 bg-red-400 rounded-full mr-2"></div><span class="text-sm">Offline</span>';
+        llmDetails.textContent = 'AGI core not available';
+        llmAvailableMain.textContent = 'Offline';
+        llmAvailableMain.className = 'text-2xl font-bold text-red-400';
+    }
+
+    // Update DAX health
+    document.getElementById('dax-health').textContent = status.status || 'Unknown';
+
+    // Update autonomous status
+    const autoStatus = document.getElementById('autonomous-status');
+    if (components.autonomous) {
+        autoStatus.innerHTML = '<div class="w-2 h-2 bg-green-400 rounded-full mr-2"></div><span class="text-sm">Active</span>';
+    } else {
+        autoStatus.innerHTML = '<div class="w-2 h-2 bg-red-400 rounded-full mr-2"></div><span class="text-sm">Inactive</span>';
+    }
+}
+
+function renderBeliefs(beliefs) {
+    document.getElementById('confidence-main').textContent = beliefs.confidence.toFixed(3);
+    document.getElementById('sidebar-confidence').textContent = beliefs.confidence.toFixed(3);
+    document.getElementById('sidebar-coherence').textContent = beliefs.coherence.toFixed(3);
+
+    // Record the point; overwriting the oldest slot once full
+    chartLabels[chartHead] = timeFormat.format(new Date());
+    confidenceBuf[chartHead] = beliefs.confidence;
+    coherenceBuf[chartHead] = beliefs.coherence;
+    chartHead = (chartHead + 1) % CHART_POINTS;
+    chartCount = Math.min(chartCount + 1, CHART_POINTS);
+
+    chartDirty = true;
+    scheduleChartDraw();
+}
+
+// Queue a chart frame; arrivals between frames share one draw
+function scheduleChartDraw() {
+    if (!chartDirty || chartFrame) {
+        return;
+    }
+    chartFrame = requestAnimationFrame(chartTick);
+}
+
+// Draw the latest ring contents, and only while the chart can be seen
+function chartTick() {
+    chartFrame = null;
+    if (!beliefsChart || !chartInView || document.hidden || !chartDirty) {
+        return;
+    }
+    copyRing(chartLabels, beliefsChart.data.labels);
+    copyRing(confidenceBuf, beliefsChart.data.datasets[0].data);
+    copyRing(coherenceBuf, beliefsChart.data.datasets[1].data);
+    beliefsChart.update('none');
+    chartDirty = false;
+}
+
+// Load Chart.js the first time the chart scrolls into view
+function observeChart() {
+    const canvas = document.getElementById('beliefs-chart');
+    const observer = new IntersectionObserver(async ([entry]) => {
+        chartInView = entry.isIntersecting;
+        if (chartInView && !beliefsChart) {
+            const { default: Chart } = await import('https://cdn.jsdelivr.net/npm/chart.js/auto/+esm');
+            if (!beliefsChart) {
+                initChart(Chart);
+                chartDirty = true;
+            }
+        }
+        scheduleChartDraw();
+    });
+    observer.observe(canvas);
+
+    // Points buffered while the tab was hidden are drawn on return
+    document.addEventListener('visibilitychange', scheduleChartDraw);
+}
+
+// Copy the ring into the chart's own array, oldest first, without reallocating it
+function copyRing(buf, out) {
+    const start = chartCount < CHART_POINTS ? 0 : chartHead;
+    out.length = chartCount;
+    for (let i = 0; i < chartCount; i++) {
+        out[i] = buf[(start + i) % CHART_POINTS];
+    }
+}
+
+// Display results
+function displayResults(results, input) {
+    const container = document.getElementById('results-container');
+    const frag = document.getElementById('result-tmpl').content.cloneNode(true);
+    frag.querySelector('.input').textContent = input;
+
+    // Reveal a section and fill its text slots
+    const show = (selector, ...texts) => {
+        const section = frag.querySelector(selector);
+        section.querySelectorAll('p').forEach((p, i) => { p.textContent = texts[i]; });
+        section.hidden = false;
+    };
+
+    if (results.dax) {
+        if (results.dax.success) {
+            show('.dax-output', results.dax.output);
+        } else {
+            show('.dax-error', results.dax.error);
+        }
+    }
+
+    if (results.mvts) {
+        if (results.mvts.success) {
+            const mvts = results.mvts.result;
+            show('.mvts-success',
+                `Success: ${mvts.success}`,
+                `Duration: ${mvts.duration.toFixed(3)}s`,
+                `Learning: ${mvts.learning.length > 0 ? mvts.learning.join(', ') : 'None'}`);
+        } else {
+            show('.mvts-error', results.mvts.error);
+        }
+    }
+
+    container.replaceChildren(frag);
+}
+
+// Rendered loop rows keyed by loop_id: {node, hash}
+const loopNodes = new Map();
+
+// Loop objects survive across deltas, so each is serialized and hashed only once
+const loopHashes = new WeakMap();
+
+function loopHash(loop) {
+    let hash = loopHashes.get(loop);
+    if (hash === undefined) {
+        hash = hashStr(JSON.stringify(loop));
+        loopHashes.set(loop, hash);
+    }
+    return hash;
+}
+
+function renderLoops(data) {
+    const loopsList = document.getElementById('loops-list');
+    if (data.recent_loops.length === 0) {
+        loopNodes.clear();
+        loopsList.innerHTML = '<p class="text-gray-400">No loops processed yet</p>';
+        return;
+    }
+
+    // Drop rows for loops that left the list, plus the placeholder and pushed rows
+    const seen = new Set(data.recent_loops.map(loop => loop.loop_id));
+    loopNodes.forEach((entry, id) => {
+        if (!seen.has(id)) {
+            loopNodes.delete(id);
+        }
+    });
+    const kept = new Set(Array.from(loopNodes.values(), entry => entry.node));
+    Array.from(loopsList.children).forEach(child => {
+        if (!kept.has(child)) {
+            child.remove();
+        }
+    });
+
+    // Walk in order, building only new or changed rows and moving only misplaced ones
+    let cursor = loopsList.firstElementChild;
+    data.recent_loops.forEach(loop => {
+        const hash = loopHash(loop);
+        let entry = loopNodes.get(loop.loop_id);
+        if (!entry || entry.hash !== hash) {
+            const node = buildLoopRow(loop);
+            if (entry) {
+                if (cursor === entry.node) {
+                    cursor = node;
+                }
+                entry.node.replaceWith(node);
+            }
+            entry = { node, hash };
+            loopNodes.set(loop.loop_id, entry);
+        }
+        if (entry.node === cursor) {
+            cursor = cursor.nextElementSibling;
+        } else {
+            loopsList.insertBefore(entry.node, cursor);
+        }
+    });
+}
+
+const MAX_LEARNING_ITEMS = 5;
+const loopRowTemplate = document.getElementById('loop-row');
+
+// Clone the row scaffold from the page's <template>; text is filled, never parsed
+function buildLoopRow(loop, source) {
+    const node = loopRowTemplate.content.firstElementChild.cloneNode(true);
+    node.querySelector('.goal').textContent = loop.goal.substring(0, 60) + (loop.goal.length > 60 ? '...' : '');
+    node.querySelector('.meta').textContent = source
+        ? `ID: ${loop.loop_id} | Source: ${source} | Duration: ${loop.duration.toFixed(3)}s`
+        : `ID: ${loop.loop_id} | Duration: ${loop.duration.toFixed(3)}s`;
+
+    const status = node.querySelector('.status');
+    status.textContent = loop.success ? 'Success' : 'Failed';
+    status.classList.add(loop.success ? 'bg-green-600' : 'bg-red-600');
+
+    if (loop.learning.length > 0) {
+        // Long learning histories collapse into a "+N more" line
+        const list = node.querySelector('.learning ul');
+        loop.learning.slice(0, MAX_LEARNING_ITEMS).forEach(item => {
+            const li = document.createElement('li');
+            li.textContent = item;
+            list.appendChild(li);
+        });
+        const extra = loop.learning.length - MAX_LEARNING_ITEMS;
+        if (extra > 0) {
+            const more = document.createElement('li');
+            more.textContent = `+${extra} more`;
+            list.appendChild(more);
+        }
+        node.querySelector('.learning').hidden = false;
+    }
+    return node;
+}
+
+const MAX_LOOP_ROWS = 10;
+
+function addLoopToUI(result, source) {
+    const loopsList = document.getElementById('loops-list');
+    const newLoop = buildLoopRow(result, source);
+    newLoop.classList.add('border-l-4', 'border-purple-500');
+
+    if (loopsList.firstChild?.classList?.contains('text-gray-400')) {
+        loopsList.removeChild(loopsList.firstChild);
+    }
+
+    // Keep only the last 10 loops: make room first so one insert never needs a trim loop
+    if (loopsList.children.length >= MAX_LOOP_ROWS) {
+        loopsList.lastElementChild.remove();
+    }
+    loopsList.insertBefore(newLoop, loopsList.firstChild);
+}
+
+// Identical concurrent POSTs share one request and response
+const inflight = new Map();
+
+function postOnce(url, body) {
+    const key = url + '|' + JSON.stringify(body);
+    let request = inflight.get(key);
+    if (!request) {
+        request = fetch(url, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(body)
+        }).then(response => response.json()).finally(() => inflight.delete(key));
+        inflight.set(key, request);
+    }
+    return request;
+}
+
+// Disable the clicked button until its request settles
+function lockButton(button) {
+    if (button) {
+        button.disabled = true;
+    }
+    return () => {
+        if (button) {
+            button.disabled = false;
+        }
+    };
+}
+
+// Processing functions
+async function processIntegrated(button) {
+    const input = document.getElementById('input-text').value.trim();
+    if (!input) {
+        alert('Please enter input text');
+        return;
+    }
+
+    const unlock = lockButton(button);
+    try {
+        const result = await postOnce('/api/integrated/process', {
+            input: input,
+            use_mvts: true,
+            use_dax: true,
+            context: {}
+        });
+        handleWebSocketUpdate({ type: 'integrated_process', results: result.results, input: result.input, timestamp: result.timestamp });
+
+    } catch (error) {
+        console.error('Error processing integrated:', error);
+        alert('Error processing integrated request');
+    } finally {
+        unlock();
+    }
+}
+
+async function processDAXOnly(button) {
+    const input = document.getElementById('input-text').value.trim();
+    if (!input) {
+        alert('Please enter input text');
+        return;
+    }
+
+    const unlock = lockButton(button);
+    try {
+        const result = await postOnce('/api/dax/process', {
+            input: input,
+            quick_mode: true
+        });
+        handleWebSocketUpdate({ type: 'integrated_process', results: { dax: { output: result.output, success: true } }, input });
+
+    } catch (error) {
+        console.error('Error processing AGI:', error);
+        alert('Error processing AGI request');
+    } finally {
+        unlock();
+    }
+}
+
+async function processMVTSOnly(button) {
+    const input = document.getElementById('input-text').value.trim();
+    if (!input) {
+        alert('Please enter input text');
+        return;
+    }
+
+    const unlock = lockButton(button);
+    try {
+        const result = await postOnce('/api/mvts/process', {
+            goal: input,
+            context: {},
+            use_dax: false
+        });
+        handleWebSocketUpdate({ type: 'integrated_process', results: { mvts: { result: result, success: true } }, input });
+
+    } catch (error) {
+        console.error('Error processing MVTS:', error);
+        alert('Error processing MVTS request');
+    } finally {
+        unlock();
+    }
+}
+
+// Process buttons carry data-action naming one of these
+const processActions = {
+    integrated: processIntegrated,
+    dax: processDAXOnly,
+    mvts: processMVTSOnly
+};
+
+// Renderers for state the server pushes over the WebSocket
+const stateRenderers = {
+    health: renderStatus,
+    beliefs: renderBeliefs,
+    loops: renderLoops,
+    world_stats: renderWorldStats,
+    layers: updateDAXLayers,
+    policy_progress: renderPolicyProgress
+};
+
+// Initialize
+document.addEventListener('DOMContentLoaded', function() {
+    // Render the state embedded in the page, then let WebSocket pushes take over
+    observeChart();
+    Object.entries(window.__DAX_BOOT__ || {}).forEach(([type, data]) => handleWebSocketUpdate({ type, data }));
+    // The decoder is served from /static and runs first, so the socket never waits on a CDN
+    decodeFrame = window.msgpackDecode;
+    initWebSocket();
+    startTimers();
+
+    // One delegated listener serves every process button, main panel and sidebar alike
+    document.body.addEventListener('click', function(event) {
+        const button = event.target.closest('[data-action]');
+        const handler = button && processActions[button.dataset.action];
+        if (handler) {
+            handler(button);
+        }
+    });
+});
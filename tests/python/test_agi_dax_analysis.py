@@ -0,0 +1,94 @@
+import importlib.util
+import os
+import sys
+import unittest
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "mvts", "agi-dax-server.py")
+
+try:
+    import fastapi  # noqa: F401
+except ImportError:  # pragma: no cover - server deps are optional here
+    fastapi = None
+
+
+def load_server():
+    spec = importlib.util.spec_from_file_location("agi_dax_server", SERVER_PATH)
+    module = sys.modules.setdefault("agi_dax_server", importlib.util.module_from_spec(spec))
+    if not hasattr(module, "AGILLMCore"):
+        spec.loader.exec_module(module)
+    return module
+
+
+@unittest.skipIf(fastapi is None, "fastapi is not installed")
+class AnalysisHelperTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.core = load_server().agi_llm
+
+    def test_risk_matches_plurals_and_stems(self):
+        cases = {
+            "Assess emerging risks and develop proactive mitigation strategies": "high",
+            "Monitor new threats to the network": "high",
+            "This is unsafe": "high",
+            "Tackle the challenges ahead": "medium",
+            "Reduce complexity in the pipeline": "medium",
+            "Explore potentially useful ideas": "medium",
+            "Plan the weekly meeting": "low",
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self.core._assess_risk(text), expected)
+
+    def test_topics_match_stems(self):
+        self.assertEqual(self.core._extract_topics("Systems for customers"), ["technology", "business"])
+        self.assertEqual(self.core._extract_topics("Researchers and students"), ["science", "education"])
+        self.assertEqual(self.core._extract_topics("Plan a trip"), [])
+
+    def test_sentiment_matches_stems(self):
+        self.assertEqual(self.core._analyze_sentiment("I loved the greatest show"), "positive")
+        self.assertEqual(self.core._analyze_sentiment("Sadly the results were poorly done"), "negative")
+        self.assertEqual(self.core._analyze_sentiment("Good but bad"), "neutral")
+
+    def test_intent_matches_whole_words(self):
+        cases = {
+            "What is the plan?": "question",
+            "Create a deployment report": "command",
+            "Analyze the server logs": "analysis",
+            "Whatever happens, keep going": "general",
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self.core._analyze_intent(text), expected)
+
+
+@unittest.skipIf(fastapi is None, "fastapi is not installed")
+class DashboardPayloadTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = load_server()
+
+    def test_fingerprint_ignores_timestamp_and_key_order(self):
+        fingerprint = self.server._fingerprint
+        self.assertEqual(fingerprint({"a": 1, "b": 2, "timestamp": "t1"}),
+                         fingerprint({"b": 2, "a": 1, "timestamp": "t2"}))
+        self.assertNotEqual(fingerprint({"a": 1}), fingerprint({"a": 2}))
+
+    def test_loops_delta(self):
+        def payload(*loops):
+            return {"active_loops": 0, "completed_loops": len(loops), "recent_loops": list(loops)}
+
+        first = payload({"loop_id": "a", "status": "done"}, {"loop_id": "b", "status": "running"})
+        message_type, data, previous = self.server._loops_delta(first, None)
+        self.assertEqual(message_type, "loops")
+        self.assertIs(data, first)
+
+        second = payload({"loop_id": "b", "status": "done"}, {"loop_id": "c", "status": "running"})
+        message_type, data, _ = self.server._loops_delta(second, previous)
+        self.assertEqual(message_type, "loops_delta")
+        self.assertEqual([loop["loop_id"] for loop in data["added"]], ["b", "c"])
+        self.assertEqual(data["ids"], ["b", "c"])
+        self.assertEqual(data["completed_loops"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
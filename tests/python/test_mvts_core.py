@@ -0,0 +1,78 @@
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+CORE_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "mvts", "mvts-core.py")
+
+
+def load_core():
+    spec = importlib.util.spec_from_file_location("mvts_core", CORE_PATH)
+    module = sys.modules.setdefault("mvts_core", importlib.util.module_from_spec(spec))
+    if not hasattr(module, "MVTSCore"):
+        spec.loader.exec_module(module)
+    return module
+
+
+mvts_core = load_core()
+
+
+class StateStoreFlushTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "state.json")
+
+    def test_deferred_change_written_on_flush(self):
+        store = mvts_core.StateStore(self.path, defer_writes=True)
+        store.add_memory({"type": "note", "text": "hello"})
+        self.assertTrue(store.dirty)
+        self.assertFalse(os.path.exists(self.path))
+
+        asyncio.run(store.flush())
+        self.assertFalse(store.dirty)
+        with open(self.path) as f:
+            saved = json.load(f)
+        self.assertEqual(saved["memory"][-1]["text"], "hello")
+
+    def test_flush_without_changes_is_noop(self):
+        store = mvts_core.StateStore(self.path, defer_writes=True)
+        asyncio.run(store.flush())
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_failed_write_stays_dirty(self):
+        store = mvts_core.StateStore(os.path.join(self.tmp.name, "missing", "state.json"), defer_writes=True)
+        store.add_memory({"type": "note"})
+        asyncio.run(store.flush())
+        self.assertTrue(store.dirty)
+
+
+class LoopHistoryTests(unittest.TestCase):
+    def test_history_overflow_keeps_newest_and_counts_all(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+
+        async def run():
+            core = mvts_core.MVTSCore({
+                "storage_path": os.path.join(tmp.name, "state.json"),
+                "auto_apply_rules": False,
+                "defer_state_writes": True,
+                "loop_history_limit": 3,
+            })
+            for i in range(5):
+                await core.process_goal(f"goal {i}")
+            return core
+
+        core = asyncio.run(run())
+        self.assertEqual(core.completed_loop_count, 5)
+        self.assertEqual(core.get_system_status()["completed_loops"], 5)
+        self.assertEqual([loop.goal for loop in core.recent_loops(10)], ["goal 2", "goal 3", "goal 4"])
+        self.assertEqual([loop.goal for loop in core.recent_loops(2)], ["goal 3", "goal 4"])
+        self.assertEqual(core.recent_loops(0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()